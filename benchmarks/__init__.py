@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for Project Vault.
+
+Run them from the repository root as modules, e.g.
+``python -m benchmarks.card_render --help``.
+"""
@@ -0,0 +1,101 @@
+"""
+Rendering time of the project grid with and without the card fragment cache.
+
+    python -m benchmarks.card_render --sizes 100 1000 10000 --json cards.json
+
+For each size three cases are measured on in-memory projects (no database):
+``uncached`` renders every card, ``cold`` renders and stores every card,
+``warm`` serves every card from the fragment cache, which is what a repeat
+page view costs when nothing changed.
+"""
+import argparse
+from datetime import timedelta
+
+from benchmarks.common import setup_django, summarize, timed, write_results
+
+
+def build_projects(count, techs_per_project=3):
+    from django.utils import timezone
+
+    from myapp.models import Project, TechStack, Technology
+
+    now = timezone.now()
+    technologies = [Technology(pk=i + 1, name=f'Tech {i}', key=f'tech {i}') for i in range(20)]
+    projects = []
+    for i in range(count):
+        project = Project(
+            pk=i + 1,
+            title=f'Project {i}',
+            description='A reasonably long project description. ' * 4,
+            status='in-progress',
+            difficulty='medium',
+            priority='high',
+            github_url='https://github.com/example/project',
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        tech_items = [
+            TechStack(pk=i * techs_per_project + j, project=project, technology=technologies[(i + j) % 20])
+            for j in range(techs_per_project)
+        ]
+        # What with_tech() leaves behind after the prefetch query
+        project._prefetched_objects_cache = {'tech_items': tech_items}
+        projects.append(project)
+    return projects
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.cache import caches
+    from django.template.loader import get_template
+    from django.test.utils import override_settings
+
+    template = get_template('project_cards.html')
+    dummy = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+    locmem = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bench-cards',
+        'OPTIONS': {'MAX_ENTRIES': max(args.sizes) * 2},
+    }
+
+    results = []
+    for size in args.sizes:
+        projects = build_projects(size)
+        render = lambda: template.render({'projects': projects})
+
+        with override_settings(CACHES={'default': locmem, 'fragments': dummy}):
+            uncached = timed(render, args.repeat)
+
+        with override_settings(CACHES={'default': locmem, 'fragments': locmem}):
+            def cold_render():
+                caches['fragments'].clear()
+                render()
+            cold = timed(cold_render, args.repeat)
+            render()
+            warm = timed(render, args.repeat)
+
+        row = {
+            'cards': size,
+            'uncached': summarize(uncached),
+            'cold': summarize(cold),
+            'warm': summarize(warm),
+        }
+        row['speedup'] = round(row['uncached']['p50_ms'] / row['warm']['p50_ms'], 2)
+        results.append(row)
+        print(
+            f"{size:>6} cards  uncached {row['uncached']['p50_ms']:>9.2f} ms  "
+            f"cold {row['cold']['p50_ms']:>9.2f} ms  warm {row['warm']['p50_ms']:>9.2f} ms  "
+            f"x{row['speedup']}"
+        )
+
+    write_results('card_render', results, args.json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""
+Time to first response of a fresh worker, with and without myapp.warmup.
+
+    python -m benchmarks.cold_start --runs 10
+    python -m benchmarks.cold_start --target gunicorn --runs 5
+
+``process`` starts ``--runs`` new interpreters per mode. Each one loads the
+WSGI application with benchmarks/settings.py, runs the warm-up (``warm``
+mode only) and then requests every page twice from the application: the
+first request pays whatever the warm-up did not, the second is the steady
+state.
+``gunicorn`` starts a one-worker gunicorn per run with gunicorn.conf.py
+(GUNICORN_WARMUP on or off) and times startup until the port accepts
+connections, then the first and second request for each page over HTTP.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from benchmarks import fixtures
+from benchmarks.common import BASE_DIR, setup_django, write_results
+from benchmarks.endpoints import SETTINGS
+
+PATHS = ['/login', '/register', '/', '/projects/']
+MODES = ['cold', 'warm']
+
+
+def request_twice(get):
+    """
+    {path: (first ms, second ms)}
+    """
+    times = {}
+    for path in PATHS:
+        samples = []
+        for _ in range(2):
+            start = time.perf_counter()
+            get(path)
+            samples.append(round((time.perf_counter() - start) * 1000, 3))
+        times[path] = samples
+    return times
+
+
+def child(warm):
+    """
+    One measured cold start, run in a fresh interpreter; prints JSON
+    """
+    start = time.perf_counter()
+    setup_django(SETTINGS)
+    from django.core.wsgi import get_wsgi_application
+
+    from myapp.warmup import warm_up, wsgi_get
+
+    application = get_wsgi_application()
+    result = {'setup_ms': round((time.perf_counter() - start) * 1000, 3), 'warmup_ms': 0}
+    if warm:
+        start = time.perf_counter()
+        warm_up(application)
+        result['warmup_ms'] = round((time.perf_counter() - start) * 1000, 3)
+    result['requests'] = request_twice(lambda path: wsgi_get(application, path))
+    print(json.dumps(result))
+
+
+def run_process(warm):
+    command = [sys.executable, '-m', 'benchmarks.cold_start', '--child']
+    if warm:
+        command.append('--warm')
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=SETTINGS)
+    output = subprocess.check_output(command, cwd=BASE_DIR, env=env)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def run_gunicorn(warm, port):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=SETTINGS, GUNICORN_WARMUP='1' if warm else '0')
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'mysite.wsgi:application',
+         '--bind', f'127.0.0.1:{port}', '--workers', '1', '--log-level', 'warning'],
+        cwd=BASE_DIR, env=env,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            if process.poll() is not None:
+                raise SystemExit('gunicorn exited, is it installed? (pip install -r requirements.txt)')
+            if time.monotonic() > deadline:
+                raise SystemExit('gunicorn did not start within 30 s')
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                break
+            except OSError:
+                time.sleep(0.01)
+        result = {'setup_ms': round((time.perf_counter() - start) * 1000, 3), 'warmup_ms': None}
+
+        def get(path):
+            try:
+                urllib.request.urlopen(f'http://127.0.0.1:{port}{path}', timeout=30).read()
+            except urllib.error.HTTPError as e:
+                e.read()
+
+        result['requests'] = request_twice(get)
+        return result
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def median(values):
+    values = [value for value in values if value is not None]
+    return round(statistics.median(values), 3) if values else None
+
+
+def summarize_runs(runs):
+    summary = {
+        'setup_ms': median(run['setup_ms'] for run in runs),
+        'warmup_ms': median(run['warmup_ms'] for run in runs),
+        'pages': {},
+    }
+    for path in PATHS:
+        first = median(run['requests'][path][0] for run in runs)
+        second = median(run['requests'][path][1] for run in runs)
+        summary['pages'][path] = {'first_ms': first, 'second_ms': second}
+    # From process start until the first page is served
+    summary['time_to_first_response_ms'] = round(
+        summary['setup_ms'] + (summary['warmup_ms'] or 0) + summary['pages'][PATHS[0]]['first_ms'], 3,
+    )
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    fixtures.add_arguments(parser)
+    parser.add_argument('--reuse', action='store_true', help='Keep the existing benchmark database')
+    parser.add_argument('--target', choices=['process', 'gunicorn'], default='process')
+    parser.add_argument('--runs', type=int, default=5, help='Cold starts per mode')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--warm', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(args.warm)
+
+    if not args.reuse:
+        setup_django(SETTINGS)
+        fixture = fixtures.seed(args.users, args.projects, args.techs, args.tech_pool, args.seed)
+        print(f"Seeded {args.users} users x {args.projects} projects in {fixture['seed_seconds']} s")
+
+    results = {}
+    for mode in MODES:
+        warm = mode == 'warm'
+        if args.target == 'process':
+            runs = [run_process(warm) for _ in range(args.runs)]
+        else:
+            runs = [run_gunicorn(warm, args.port) for _ in range(args.runs)]
+        results[mode] = summary = summarize_runs(runs)
+        print(
+            f"{mode:<5} setup {summary['setup_ms']:>8.1f} ms  warm-up {summary['warmup_ms'] or 0:>7.1f} ms  "
+            f"first response {summary['time_to_first_response_ms']:>8.1f} ms"
+        )
+        for path, page in summary['pages'].items():
+            print(f"      {path:<12} first {page['first_ms']:>8.2f} ms  second {page['second_ms']:>8.2f} ms")
+
+    write_results('cold_start', {'target': args.target, 'runs': args.runs, 'modes': results}, args.json)
+
+
+if __name__ == '__main__':
+    main()
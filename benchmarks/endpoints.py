@@ -0,0 +1,299 @@
+"""
+Latency percentiles and throughput of the vault's hot endpoints.
+
+    python -m benchmarks.endpoints --users 10 --projects 1000 --requests 200
+    python -m benchmarks.endpoints --target gunicorn --workers 4 --concurrency 8
+
+The benchmark database (benchmarks/settings.py, BENCH_DB) is seeded with
+benchmarks.fixtures first, unless --reuse is given. ``client`` drives the
+views in-process through Django's test client, one request at a time, which
+isolates the server-side cost. ``gunicorn`` starts a local gunicorn and
+sends real HTTP requests from ``--concurrency`` threads, one user each.
+Redirects are not followed, every request is measured on its own.
+"""
+import argparse
+import http.cookiejar
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import fixtures
+from benchmarks.common import BASE_DIR, setup_django, summarize, write_results
+
+SETTINGS = 'benchmarks.settings'
+
+
+class ClientSession:
+    """
+    In-process session on Django's test client
+    """
+    def __init__(self, base_url=None):
+        from django.test import Client
+
+        self.client = Client()
+
+    def login(self, username):
+        from django.contrib.auth.models import User
+
+        self.client.force_login(User.objects.get(username=username))
+
+    def get(self, path, params=None):
+        return self.client.get(path, params or {}).status_code
+
+    def post(self, path, data=None):
+        return self.client.post(path, data or {}).status_code
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpSession:
+    """
+    Cookie-keeping HTTP session that sends the CSRF token like a browser form
+    """
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), _NoRedirect,
+        )
+
+    def _open(self, request):
+        try:
+            with self.opener.open(request, timeout=60) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            return e.code  # Including the unfollowed redirects
+
+    def _csrf_token(self):
+        for cookie in self.cookies:
+            if cookie.name == 'csrftoken':
+                return cookie.value
+        self.get('/login')
+        return self._csrf_token()
+
+    def login(self, username):
+        self.post('/login', {'username': username, 'password': fixtures.PASSWORD})
+
+    def get(self, path, params=None):
+        query = f'?{urllib.parse.urlencode(params, doseq=True)}' if params else ''
+        return self._open(urllib.request.Request(self.base_url + path + query))
+
+    def post(self, path, data=None):
+        token = self._csrf_token()
+        body = urllib.parse.urlencode(dict(data or {}, csrfmiddlewaretoken=token), doseq=True).encode()
+        return self._open(urllib.request.Request(
+            self.base_url + path, data=body, headers={'X-CSRFToken': token},
+        ))
+
+
+def index(session, state, i):
+    return session.get('/')
+
+
+def project_list(session, state, i):
+    return session.get('/projects/', {'status': 'in-progress'} if i % 2 else None)
+
+
+def search(session, state, i):
+    return session.get('/projects/search/', {'q': fixtures.WORDS[i % len(fixtures.WORDS)]})
+
+
+def register(session, state, i):
+    name = f"bench-new-{state['run']}-{state['worker']}-{i}"
+    return session.post('/register', {
+        'username': name,
+        'email': f'{name}@example.com',
+        'password': fixtures.PASSWORD,
+        'password2': fixtures.PASSWORD,
+    })
+
+
+def login(session, state, i):
+    return session.post('/login', {'username': state['username'], 'password': fixtures.PASSWORD})
+
+
+def update_project(session, state, i):
+    project_id = state['project_ids'][i % len(state['project_ids'])]
+    return session.post(f'/update-project/{project_id}/', {
+        'title': f'Updated project {i}',
+        'tech_stack': fixtures.TECHNOLOGIES[i % 5:i % 5 + 3],
+    })
+
+
+def delete_project(session, state, i):
+    return session.post(f"/delete-project/{state['project_ids'].pop()}/")
+
+
+# (name, function, signed in); deletes run last since they consume projects
+SCENARIOS = [
+    ('index', index, True),
+    ('project_list', project_list, True),
+    ('search', search, True),
+    ('register', register, False),
+    ('login', login, False),
+    ('update_project', update_project, True),
+    ('delete_project', delete_project, True),
+]
+
+
+def worker_states(workers):
+    from django.contrib.auth.models import User
+
+    from myapp.models import Project
+
+    run = uuid.uuid4().hex[:8]
+    users = list(User.objects.filter(username__startswith='bench-user-').order_by('id')[:workers])
+    if len(users) < workers:
+        raise SystemExit(f'Need one seeded user per worker, found {len(users)} for {workers} workers')
+    return [
+        {
+            'run': run,
+            'worker': worker,
+            'username': user.username,
+            'project_ids': list(Project.objects.filter(user=user).order_by('id').values_list('id', flat=True)),
+        }
+        for worker, user in enumerate(users)
+    ]
+
+
+def run_scenario(func, sessions, states, requests):
+    """
+    Send ``requests`` requests split over the sessions, one thread per session
+    """
+    per_worker = [requests // len(sessions) + (w < requests % len(sessions)) for w in range(len(sessions))]
+    samples = []
+    errors = 0
+    lock = threading.Lock()
+
+    def work(worker):
+        nonlocal errors
+        local, failed = [], 0
+        for i in range(per_worker[worker]):
+            start = time.perf_counter()
+            status = func(sessions[worker], states[worker], i)
+            local.append(time.perf_counter() - start)
+            failed += status >= 400
+        with lock:
+            samples.extend(local)
+            errors += failed
+
+    start = time.perf_counter()
+    if len(sessions) == 1:
+        work(0)
+    else:
+        with ThreadPoolExecutor(len(sessions)) as pool:
+            list(pool.map(work, range(len(sessions))))
+    wall = time.perf_counter() - start
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'wall_s': round(wall, 3),
+        'throughput_rps': round(len(samples) / wall, 1) if wall else None,
+        'latency': summarize(samples),
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_gunicorn(workers, port):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=SETTINGS)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'mysite.wsgi:application',
+         '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--log-level', 'warning'],
+        cwd=BASE_DIR, env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit('gunicorn exited, is it installed? (pip install -r requirements.txt)')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise SystemExit('gunicorn did not start within 30 s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    fixtures.add_arguments(parser)
+    parser.add_argument('--reuse', action='store_true', help='Keep the existing benchmark database')
+    parser.add_argument('--target', choices=['client', 'gunicorn'], default='client')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    parser.add_argument('--concurrency', type=int, default=4, help='Client threads for --target gunicorn')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per scenario')
+    parser.add_argument('--warmup', type=int, default=5, help='Unmeasured requests per scenario and worker')
+    parser.add_argument('--only', nargs='+', choices=[name for name, _, _ in SCENARIOS])
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    setup_django(SETTINGS)
+    fixture = None
+    if not args.reuse:
+        fixture = fixtures.seed(args.users, args.projects, args.techs, args.tech_pool, args.seed)
+        print(f"Seeded {args.users} users x {args.projects} projects in {fixture['seed_seconds']} s")
+
+    concurrency = 1 if args.target == 'client' else args.concurrency
+    states = worker_states(concurrency)
+    server = None
+    if args.target == 'gunicorn':
+        port = free_port()
+        server = start_gunicorn(args.workers, port)
+        session_class, base_url = HttpSession, f'http://127.0.0.1:{port}'
+    else:
+        session_class, base_url = ClientSession, None
+
+    results = []
+    try:
+        signed_in = [session_class(base_url) for _ in states]
+        for session, state in zip(signed_in, states):
+            session.login(state['username'])
+
+        for name, func, needs_login in SCENARIOS:
+            if args.only and name not in args.only:
+                continue
+            sessions = signed_in if needs_login else [session_class(base_url) for _ in states]
+            if name != 'delete_project':
+                for session, state in zip(sessions, states):
+                    for i in range(args.warmup):
+                        func(session, state, -1 - i)
+            row = dict(endpoint=name, **run_scenario(func, sessions, states, args.requests))
+            results.append(row)
+            latency = row['latency']
+            print(
+                f"{name:<16}{row['throughput_rps']:>9} req/s  p50 {latency['p50_ms']:>8.2f} ms  "
+                f"p95 {latency['p95_ms']:>8.2f} ms  p99 {latency['p99_ms']:>8.2f} ms  errors {row['errors']}"
+            )
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    write_results('endpoints', {
+        'target': args.target,
+        'workers': args.workers if server else None,
+        'concurrency': concurrency,
+        'fixture': fixture or 'reused',
+        'endpoints': results,
+    }, args.json)
+
+
+if __name__ == '__main__':
+    main()
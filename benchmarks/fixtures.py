@@ -0,0 +1,127 @@
+"""
+Deterministic synthetic vaults for the benchmarks.
+
+    python -m benchmarks.fixtures --users 10 --projects 1000 --techs 4
+
+Every user gets ``projects`` projects with ``techs`` tech items each, drawn
+from a pool of ``tech_pool`` technologies. The same arguments and ``--seed``
+always produce the same rows, so runs on different commits are comparable.
+"""
+import argparse
+import random
+import time
+from datetime import timedelta
+
+from benchmarks.common import setup_django
+
+PASSWORD = 'Bench-pass-123!'
+WORDS = (
+    'api dashboard tracker portfolio chat weather budget recipe fitness '
+    'inventory blog scheduler analytics game notes crawler bot shop quiz map'
+).split()
+TECHNOLOGIES = (
+    'Python Django Flask FastAPI React Vue Svelte Angular TypeScript JavaScript '
+    'PostgreSQL SQLite MySQL Redis Docker Kubernetes Go Rust Node.js Tailwind'
+).split()
+
+
+def username(index):
+    return f'bench-user-{index}'
+
+
+def seed(users=10, projects=1000, techs=4, tech_pool=50, seed=0, batch_size=1000):
+    """
+    Empty the benchmark database and fill it with a synthetic vault.
+    Returns the fixture parameters together with the seeding time.
+    """
+    from django.contrib.auth.hashers import make_password
+    from django.contrib.auth.models import User
+    from django.core.cache import caches
+    from django.core.management import call_command
+    from django.utils import timezone
+
+    from myapp.models import Project, TechStack, Technology, tech_key
+
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    call_command('migrate', verbosity=0)
+    call_command('flush', interactive=False, verbosity=0)
+    for cache in caches.all():
+        cache.clear()
+
+    # Hashing is the slow part of creating users, do it once
+    password = make_password(PASSWORD)
+    User.objects.bulk_create([
+        User(username=username(i), email=f'{username(i)}@example.com', password=password)
+        for i in range(users)
+    ])
+
+    names = [
+        TECHNOLOGIES[i] if i < len(TECHNOLOGIES) else f'{TECHNOLOGIES[i % len(TECHNOLOGIES)]} {i}'
+        for i in range(tech_pool)
+    ]
+    technologies = Technology.objects.bulk_create([
+        Technology(name=name, key=tech_key(name)) for name in names
+    ])
+
+    now = timezone.now()
+    statuses = [value for value, _ in Project.STATUS_CHOICES]
+    levels = [value for value, _ in Project.DIFFICULTY_CHOICES]
+    priorities = [value for value, _ in Project.PRIORITY_CHOICES]
+    for user in User.objects.order_by('id'):
+        for offset in range(0, projects, batch_size):
+            batch = []
+            for i in range(offset, min(offset + batch_size, projects)):
+                words = rng.sample(WORDS, 3)
+                batch.append(Project(
+                    user=user,
+                    title=' '.join(words).title(),
+                    description=f'A {words[0]} {words[1]} built to learn {rng.choice(names)}. ' * 3,
+                    status=rng.choice(statuses),
+                    difficulty=rng.choice(levels),
+                    priority=rng.choice(priorities),
+                    github_url=f'https://github.com/{user.username}/project-{i}',
+                ))
+            Project.objects.bulk_create(batch)
+
+            # auto_now_add ignores explicit values, spread the projects over a year
+            for project in batch:
+                project.created_at = now - timedelta(minutes=rng.randrange(525600))
+            Project.objects.bulk_update(batch, ['created_at'])
+
+            TechStack.objects.bulk_create([
+                TechStack(project=project, technology=technology)
+                for project in batch
+                for technology in rng.sample(technologies, min(techs, len(technologies)))
+            ])
+
+    return {
+        'users': users,
+        'projects_per_user': projects,
+        'techs_per_project': techs,
+        'tech_pool': tech_pool,
+        'seed': seed,
+        'seed_seconds': round(time.perf_counter() - start, 2),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--projects', type=int, default=1000, help='Projects per user')
+    parser.add_argument('--techs', type=int, default=4, help='Tech items per project')
+    parser.add_argument('--tech-pool', type=int, default=50, help='Number of distinct technologies')
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    setup_django('benchmarks.settings')
+    fixture = seed(args.users, args.projects, args.techs, args.tech_pool, args.seed)
+    print(f"Seeded {args.users} users x {args.projects} projects in {fixture['seed_seconds']} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Update latency with the project history off and on.
+
+    python -m benchmarks.history_overhead --requests 500 --rounds 5
+
+Sends ``--requests`` updates per round and mode through Django's test
+client, alternating ``off`` and ``on`` (HISTORY_ENABLED) so drift in the
+machine or the database affects both alike. With history on, every update
+queues a ProjectEvent and the background writer inserts them in batches
+while the updates run, so its database writes are part of the measurement.
+``written`` is the number of events in the database once the writer has
+been stopped and flushed.
+"""
+import argparse
+import itertools
+
+from benchmarks import fixtures
+from benchmarks.common import setup_django, summarize, timed, write_results
+from benchmarks.endpoints import SETTINGS, ClientSession, update_project, worker_states
+
+MODES = ['off', 'on']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    fixtures.add_arguments(parser)
+    parser.add_argument('--reuse', action='store_true', help='Keep the existing benchmark database')
+    parser.add_argument('--requests', type=int, default=500, help='Updates per round and mode')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=20, help='Unmeasured updates per mode')
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    setup_django(SETTINGS)
+    from django.conf import settings
+    from django.test.utils import override_settings
+
+    from myapp import history
+    from myapp.models import ProjectEvent
+
+    fixture = None
+    if not args.reuse:
+        fixture = fixtures.seed(args.users, args.projects, args.techs, args.tech_pool, args.seed)
+        print(f"Seeded {args.users} users x {args.projects} projects in {fixture['seed_seconds']} s")
+
+    state = worker_states(1)[0]
+    session = ClientSession()
+    session.login(state['username'])
+    counter = itertools.count()  # A new title on every update, so each one changes the row
+
+    def update():
+        update_project(session, state, next(counter))
+
+    before = ProjectEvent.objects.count()
+    samples = {mode: [] for mode in MODES}
+    for mode in MODES:
+        with override_settings(HISTORY_ENABLED=mode == 'on'):
+            timed(update, args.warmup)
+    for _ in range(args.rounds):
+        for mode in MODES:
+            with override_settings(HISTORY_ENABLED=mode == 'on'):
+                samples[mode].extend(timed(update, args.requests))
+
+    writer = history.get_writer()
+    writer.stop()
+    written = ProjectEvent.objects.count() - before
+
+    results = {mode: summarize(samples[mode]) for mode in MODES}
+    for mode in MODES:
+        latency = results[mode]
+        print(
+            f"history {mode:<4} p50 {latency['p50_ms']:>7.2f} ms  p95 {latency['p95_ms']:>7.2f} ms  "
+            f"p99 {latency['p99_ms']:>7.2f} ms  mean {latency['mean_ms']:>7.2f} ms"
+        )
+    print(f"written {written} events, dropped {writer.dropped}, batches of up to {settings.HISTORY_BATCH_SIZE}")
+
+    write_results('history_overhead', {
+        'fixture': fixture or 'reused',
+        'requests': args.requests,
+        'rounds': args.rounds,
+        'batch_size': settings.HISTORY_BATCH_SIZE,
+        'flush_interval': settings.HISTORY_FLUSH_INTERVAL,
+        'written': written,
+        'dropped': writer.dropped,
+        'latency': results,
+    }, args.json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Password verifications (logins) per second for each PASSWORD_HASHER choice.
+
+    python -m benchmarks.password_hashing --clients 16 --workers 4 --queue 8
+
+``serial`` verifies on the calling thread, one login per core at a time.
+``pool`` sends ``--logins`` verifications from ``--clients`` threads through
+an auth_pool.HashingPool of ``--workers`` threads and ``--queue`` waiting
+slots, as concurrent login requests would; ``rejected`` counts the ones
+answered with 429. Compare the same arguments across hashers and costs
+(SCRYPT_*, ARGON2_* environment variables).
+"""
+import argparse
+import importlib.util
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import setup_django, summarize, timed, write_results
+
+PASSWORD = 'Bench-pass-123!'
+
+
+def serial(encoded, repeat):
+    from django.contrib.auth.hashers import check_password
+
+    samples = timed(lambda: check_password(PASSWORD, encoded), repeat)
+    return {'logins_per_s': round(len(samples) / sum(samples), 1), 'latency': summarize(samples)}
+
+
+def pooled(encoded, logins, clients, workers, queue):
+    from django.contrib.auth.hashers import check_password
+
+    from myapp.auth_pool import HashingBusy, HashingPool
+
+    pool = HashingPool(workers, queue)
+    samples, rejected = [], 0
+    lock = threading.Lock()
+
+    def login(_):
+        nonlocal rejected
+        start = time.perf_counter()
+        try:
+            pool.run(check_password, PASSWORD, encoded)
+        except HashingBusy:
+            with lock:
+                rejected += 1
+            return
+        with lock:
+            samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as executor:
+        list(executor.map(login, range(logins)))
+    wall = time.perf_counter() - start
+    pool.executor.shutdown()
+    return {
+        'logins_per_s': round(len(samples) / wall, 1),
+        'logins_per_s_per_worker': round(len(samples) / wall / workers, 1),
+        'rejected': rejected,
+        'latency': summarize(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--hashers', nargs='+', default=['pbkdf2', 'scrypt', 'argon2'])
+    parser.add_argument('--repeat', type=int, default=20, help='Serial verifications per hasher')
+    parser.add_argument('--logins', type=int, default=200, help='Pooled verifications per hasher')
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--queue', type=int, default=8)
+    parser.add_argument('--json', help='Write machine-readable results to this file')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.hashers import make_password
+    from django.test.utils import override_settings
+
+    results = []
+    for name in args.hashers:
+        if name == 'argon2' and importlib.util.find_spec('argon2') is None:
+            print(f'{name:<8} skipped, argon2-cffi is not installed')
+            continue
+        with override_settings(PASSWORD_HASHERS=[settings.PREFERRED_PASSWORD_HASHERS[name]]):
+            encoded = make_password(PASSWORD)
+            row = {
+                'hasher': name,
+                'serial': serial(encoded, args.repeat),
+                'pool': pooled(encoded, args.logins, args.clients, args.workers, args.queue),
+            }
+        results.append(row)
+        print(
+            f"{name:<8} serial {row['serial']['logins_per_s']:>7} logins/s  "
+            f"p50 {row['serial']['latency']['p50_ms']:>8.2f} ms  |  "
+            f"pool {row['pool']['logins_per_s']:>7} logins/s "
+            f"({row['pool']['logins_per_s_per_worker']}/worker)  "
+            f"p95 {row['pool']['latency']['p95_ms']:>8.2f} ms  rejected {row['pool']['rejected']}"
+        )
+
+    write_results('password_hashing', {
+        'clients': args.clients, 'workers': args.workers, 'queue': args.queue, 'hashers': results,
+    }, args.json)
+
+
+if __name__ == '__main__':
+    main()
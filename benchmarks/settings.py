@@ -0,0 +1,25 @@
+"""
+Settings for benchmark runs: production-like (DEBUG off) against a separate
+SQLite database, so seeding never touches db.sqlite3.
+
+BENCH_DB overrides the database path.
+"""
+from mysite.database import database_config, sqlite_pragmas
+from mysite.settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['127.0.0.1', 'localhost', 'testserver']
+
+# The benchmarks measure views, not static files, so skip collectstatic
+STORAGES = dict(STORAGES, staticfiles={'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'})
+
+# Every benchmark client comes from 127.0.0.1, the limits would reject most of them
+RATELIMIT_ENABLED = False
+
+BENCH_DB = os.environ.get('BENCH_DB', os.path.join(tempfile.gettempdir(), 'projectvault-bench.sqlite3'))
+
+DATABASES = {
+    'default': database_config(f'sqlite:///{BENCH_DB}'),
+}
+SQLITE_PRAGMAS = sqlite_pragmas()
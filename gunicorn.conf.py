@@ -0,0 +1,66 @@
+"""
+Gunicorn settings, read from the working directory:
+
+    gunicorn mysite.wsgi:application
+    gunicorn mysite.asgi:application -k uvicorn.workers.UvicornWorker
+
+Every value can be overridden on the command line or through the
+GUNICORN_* environment variables below. Each worker runs myapp.warmup
+before it accepts requests, so the first visitors after a deploy or a
+worker restart do not pay for URL resolution, template compilation, lazy
+imports and the database connection.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+# One process per CPU with a few request threads each (the gthread worker).
+# Password hashing gets about one thread per CPU across the processes, and
+# at most half the threads of a process, so a burst of logins is answered
+# with 429 while the other threads keep serving pages (myapp/auth_pool.py).
+# mysite/settings.py reads the same variables and defaults.
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+# Recycle workers now and then; the jitter keeps them from restarting together
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Load Django once in the master and fork the workers from it. Workers start
+# faster and share the imported code and compiled templates copy-on-write.
+# A preloaded app is not reloaded on HUP; restart the master to deploy.
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') in ('1', 'true', 'True')
+
+# Run myapp.warmup in every worker before it accepts requests
+warmup = os.environ.get('GUNICORN_WARMUP', '1') in ('1', 'true', 'True')
+
+
+def when_ready(server):
+    if not (warmup and server.cfg.preload_app):
+        return
+    from django.db import connections
+
+    from myapp.warmup import is_asgi, warm_up
+
+    # Compiled templates, the URL resolver and the modules imported by the
+    # warm-up requests are inherited by every fork. Database connections
+    # must not be shared between processes. An ASGI app (uvicorn workers)
+    # is only requested in the workers: serving it starts an event loop and
+    # threads, which must not be forked either.
+    application = server.app.wsgi()
+    report = warm_up(None if is_asgi(application) else application, database=False)
+    connections.close_all()
+    server.log.info('Warmed up the master: %s', report)
+
+
+def post_worker_init(worker):
+    from myapp import auth_pool
+
+    # The layout this worker really runs with, command line included
+    auth_pool.configure(worker.cfg.workers, worker.cfg.threads)
+    if not warmup:
+        return
+    from myapp.warmup import warm_up
+
+    report = warm_up(worker.wsgi)
+    worker.log.info('Warmed up worker %s: %s', worker.pid, report)
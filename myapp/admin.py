@@ -1,6 +1,125 @@
+from django import forms
 from django.contrib import admin
-from .models import Project, TechStack
+from django.utils import timezone
+from .caching import invalidate_owner
+from .models import Project, ProjectEvent, TechStack, Technology, clean_tech_name, tech_key
+from .pagination import EstimatedCountPaginator
 # Register your models here.
 
-admin.site.register(Project)
-admin.site.register(TechStack)
+
+def touch_projects(projects):
+    """
+    Move updated_at of ``projects`` so their cached cards and the vault ETag
+    change, and drop their owners' cached aggregates. For edits the admin
+    makes to technologies and tech stack rows, which are not Project saves.
+    """
+    owners = set(projects.values_list('user_id', 'session_key'))
+    # QuerySet.update() skips auto_now and sends no signals
+    projects.update(updated_at=timezone.now())
+    for owner in owners:
+        invalidate_owner(*owner)
+
+
+class TechStackInline(admin.TabularInline):
+    model = TechStack
+    extra = 0
+    autocomplete_fields = ['technology']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('technology')
+
+
+@admin.register(Project)
+class ProjectAdmin(admin.ModelAdmin):
+    list_display = ['title', 'user', 'status', 'difficulty', 'priority', 'created_at']
+    list_select_related = ['user']
+    # Each filter has an index on (field, -created_at), see Project.Meta
+    list_filter = ['status', 'difficulty', 'priority', 'created_at']
+    ordering = ['-created_at', '-id']
+    search_fields = ['title']
+    raw_id_fields = ['user']
+    readonly_fields = ['session_key', 'created_at', 'updated_at']
+    inlines = [TechStackInline]
+    # No COUNT(*) of the whole table on every changelist page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class TechnologyAdminForm(forms.ModelForm):
+    class Meta:
+        model = Technology
+        fields = ['name']
+
+    def clean_name(self):
+        # key is derived from the name in save_model(), so the unique check on
+        # it has to happen here; otherwise a rename onto an existing spelling
+        # fails in the database
+        name = clean_tech_name(self.cleaned_data['name'])
+        if not name:
+            raise forms.ValidationError('This field is required.', code='required')
+        if Technology.objects.filter(key=tech_key(name)).exclude(pk=self.instance.pk).exists():
+            raise forms.ValidationError('A technology with this name already exists.', code='unique')
+        return name
+
+
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    form = TechnologyAdminForm
+    list_display = ['name', 'key']
+    ordering = ['key']
+    search_fields = ['name']
+    readonly_fields = ['key']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def save_model(self, request, obj, form, change):
+        obj.key = tech_key(obj.name)
+        super().save_model(request, obj, form, change)
+        if change and 'name' in form.changed_data:
+            # Every card listing the technology shows the new name
+            touch_projects(Project.objects.filter(tech_items__technology=obj))
+
+
+@admin.register(TechStack)
+class TechStackAdmin(admin.ModelAdmin):
+    list_display = ['project', 'technology']
+    list_select_related = ['project', 'technology']
+    ordering = ['-id']
+    autocomplete_fields = ['project', 'technology']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # A link moved to another project changes both cards
+        touch_projects(Project.objects.filter(pk__in={obj.project_id, form.initial.get('project')} - {None}))
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        touch_projects(Project.objects.filter(pk=obj.project_id))
+
+    def delete_queryset(self, request, queryset):
+        # touch_projects() also invalidates the owners, once rather than per
+        # row in signals.tech_stack_changed
+        project_ids = set(queryset.values_list('project_id', flat=True))
+        queryset.invalidates_owners = True
+        super().delete_queryset(request, queryset)
+        touch_projects(Project.objects.filter(pk__in=project_ids))
+
+
+@admin.register(ProjectEvent)
+class ProjectEventAdmin(admin.ModelAdmin):
+    # Ids only: the project or user of an event may no longer exist
+    list_display = ['created_at', 'kind', 'project_id', 'user_id', 'changes']
+    list_filter = ['kind']
+    ordering = ['-id']
+    search_fields = ['=project__id']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # History is written by myapp.history only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
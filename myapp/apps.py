@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class MyappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'myapp'
+
+    def ready(self):
+        from django.conf import settings
+        from django.core.signals import request_started
+        from django.db.backends.signals import connection_created
+
+        from mysite.database import configure_sqlite
+
+        from . import signals  # noqa: F401 - connects the cache invalidation handlers
+
+        connection_created.connect(configure_sqlite, dispatch_uid='configure_sqlite')
+
+        if settings.DEMO_PURGE_INTERVAL > 0:
+            from .demo import ensure_purge_thread
+            request_started.connect(ensure_purge_thread, dispatch_uid='demo_purge_thread')
@@ -0,0 +1,133 @@
+"""
+Async versions of the listing, update and delete endpoints, routed instead
+of their counterparts in views.py when settings.ASYNC_VIEWS is on.
+
+Under ASGI they wait for the database without holding a thread, so one
+process can serve many slow clients. Sessions, authentication, template
+rendering and the transactional update are still synchronous in Django 4.2;
+each of those runs in a single sync_to_async call.
+"""
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.http import Http404, JsonResponse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from .history import record, record_project
+from .models import Project, ProjectEvent
+from .pagination import InvalidCursor, akeyset_page, parse_page_size
+from .ratelimit import ratelimit
+from .views import (
+    VAULT_VERSION, apply_project_update, demo_session_key, listing_filters, vault_version,
+)
+
+
+def async_csrf_exempt(view):
+    # csrf_exempt wraps views in a sync function before Django 5.0
+    view.csrf_exempt = True
+    return view
+
+
+@sync_to_async
+def load_visitor(request):
+    """
+    (user, demo session key, has pending messages), resolving the lazy user
+    and session in one thread hop
+    """
+    user = request.user
+    user.is_authenticated  # Evaluates the lazy object
+    return user, demo_session_key(request), bool(len(messages.get_messages(request)))
+
+
+def with_vault_headers(response, etag, last_modified):
+    """
+    The headers the condition and cache_control decorators set on the sync views
+    """
+    if etag:
+        response.headers.setdefault('ETag', etag)
+    if last_modified and not response.has_header('Last-Modified'):
+        response.headers['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+async def project_list(request):
+    """
+    Return a page of (optionally filtered) project cards as HTML for infinite scroll
+    """
+    user, session_key, has_messages = await load_visitor(request)
+    projects = Project.objects.visible_to(user, session_key)
+
+    etag = last_modified = None
+    if request.method in ('GET', 'HEAD') and not has_messages:
+        vault = await projects.aaggregate(**VAULT_VERSION)
+        etag, latest = vault_version(vault, user.pk or session_key, request.get_full_path())
+        etag = quote_etag(etag)
+        last_modified = int(latest.timestamp()) if latest else None
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            return with_vault_headers(response, etag, last_modified)
+
+    try:
+        page, next_cursor = await akeyset_page(
+            projects.matching(**listing_filters(request.GET)).with_tech(),
+            cursor=request.GET.get('cursor'),
+            size=parse_page_size(request.GET.get('limit')),
+        )
+    except InvalidCursor as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+
+    html = await sync_to_async(render_to_string)('project_cards.html', {'projects': page}, request=request)
+    response = JsonResponse({'success': True, 'html': html, 'next_cursor': next_cursor})
+    return with_vault_headers(response, etag, last_modified)
+
+
+async def get_visitor_project(request, project_id):
+    """
+    Async get_object_or_404 over the projects the visitor may edit
+    """
+    user, session_key, _ = await load_visitor(request)
+    try:
+        return await Project.objects.visible_to(user, session_key).aget(id=project_id)
+    except Project.DoesNotExist:
+        raise Http404('No Project matches the given query.')
+
+
+@async_csrf_exempt
+@ratelimit('update')
+async def update_project(request, project_id):
+    """
+    Update an existing project via AJAX
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+    try:
+        user, session_key, _ = await load_visitor(request)
+        projects = Project.objects.visible_to(user, session_key)
+        project, changes = await sync_to_async(apply_project_update)(projects, project_id, request.POST)
+        if changes:
+            record_project(ProjectEvent.UPDATED, project, changes)
+        return JsonResponse({'success': True, 'message': 'Project updated successfully'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error updating project: {str(e)}'})
+
+
+@async_csrf_exempt
+@ratelimit('delete')
+async def delete_project(request, project_id):
+    """
+    Delete a project via AJAX
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+    try:
+        project = await get_visitor_project(request, project_id)
+        project_pk = project.pk  # adelete() clears it
+        await project.adelete()
+        record(ProjectEvent.DELETED, project_pk, project.user_id, project.session_key, {'title': project.title})
+        return JsonResponse({'success': True, 'message': 'Project deleted successfully'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error deleting project: {str(e)}'})
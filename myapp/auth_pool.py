@@ -0,0 +1,108 @@
+"""
+Bounded thread pool for password hashing.
+
+Hashing a password costs tens to hundreds of milliseconds of CPU. hashlib
+releases the GIL while it hashes, so running it on a small pool bounds the
+number of concurrent hashes per process while other request threads keep
+running. Beyond the pool's workers and queue HashingBusy is raised at once,
+and the views answer 429 instead of tying up every request thread with
+logins until requests time out.
+
+pool_size() derives both from the server layout: the hashing threads are
+shared out so the host runs about one hash per CPU, and at most half of a
+process's request threads may be hashing or waiting. gunicorn.conf.py
+passes the actual layout to configure() in every worker.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+
+class HashingBusy(Exception):
+    pass
+
+
+class HashingPool:
+    def __init__(self, workers, max_queue):
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix='password-hashing')
+        # One slot per running or waiting job
+        self.slots = threading.BoundedSemaphore(workers + max_queue)
+
+    def run(self, func, *args):
+        """
+        Run ``func(*args)`` on the pool and wait for the result
+        """
+        if not self.slots.acquire(blocking=False):
+            raise HashingBusy
+        try:
+            future = self.executor.submit(func, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future.result()
+
+
+def pool_size(processes, threads):
+    """
+    (hashing threads, queue) for one of ``processes`` server processes on
+    the host, each serving ``threads`` requests at once. AUTH_HASH_WORKERS
+    and AUTH_HASH_QUEUE override the computed values.
+    """
+    # Request threads that may be hashing or waiting; with a single request
+    # thread the one login must still be served
+    slots = max(1, threads // 2)
+    workers = settings.AUTH_HASH_WORKERS
+    if workers is None:
+        workers = min(slots, max(1, (os.cpu_count() or 1) // processes))
+    queue = settings.AUTH_HASH_QUEUE
+    if queue is None:
+        queue = max(0, slots - workers)
+    return workers, queue
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def configure(processes, threads):
+    """
+    Size the pool of the current process for the server layout
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        _pool = HashingPool(*pool_size(processes, threads))
+        _pool_pid = os.getpid()
+        return _pool
+
+
+def get_pool():
+    """
+    The pool of the current process (threads do not survive a fork), sized
+    from SERVER_PROCESSES and SERVER_THREADS unless configure() was called
+    """
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            return _pool
+    return configure(settings.SERVER_PROCESSES, settings.SERVER_THREADS)
+
+
+def hash_password(raw_password):
+    return get_pool().run(make_password, raw_password)
+
+
+def verify_password(raw_password, encoded):
+    """
+    (is correct, needs rehashing with the preferred hasher)
+    """
+    def verify():
+        outdated = []
+        # The setter is only called for correct passwords that need an upgrade
+        correct = check_password(raw_password, encoded, setter=outdated.append)
+        return correct, bool(outdated)
+
+    return get_pool().run(verify)
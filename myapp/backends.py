@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+
+from .auth_pool import hash_password, verify_password
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend that hashes on the bounded pool of auth_pool.py (raising
+    HashingBusy when it is full) and upgrades outdated hashes on login
+    """
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash anyway, so unknown usernames take as long as wrong passwords
+            hash_password(password)
+            return None
+
+        correct, outdated = verify_password(password, user.password)
+        if not correct or not self.user_can_authenticate(user):
+            return None
+        if outdated:
+            # The preferred hasher or its cost changed since the password was set
+            user.password = hash_password(password)
+            user.save(update_fields=['password'])
+        return user
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+class CachedModelBackend(PooledModelBackend):
+    """
+    Serves the per-request user lookup of AuthenticationMiddleware from the
+    cache. Entries are dropped by signals.user_changed when the user is
+    saved or deleted; QuerySet.update() on users must call invalidate_user().
+    """
+    def get_user(self, user_id):
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is not None:
+                cache.set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+        return user
+
+
+def invalidate_user(user_id):
+    cache.delete(user_cache_key(user_id))
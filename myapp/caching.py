@@ -0,0 +1,70 @@
+"""
+Per-owner cached aggregates for the project listing.
+
+An owner is a user id, or the session key of an anonymous demo visitor.
+Entries are dropped by the signal handlers in signals.py whenever a
+Project or TechStack row is saved or deleted; code that writes without
+sending signals (bulk_create, QuerySet.update) must call invalidate_owner().
+"""
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Project, Technology
+
+# Entries are invalidated on write, the timeout only bounds staleness if
+# an invalidation is ever missed
+CACHE_TIMEOUT = 60 * 60
+
+# Number of technologies listed in the stats
+TOP_TECHNOLOGIES = 5
+
+
+def owner_key(user_id, session_key=None):
+    return f'user:{user_id}' if user_id else f'session:{session_key}'
+
+
+def tech_counts_key(user_id, session_key=None):
+    return f'vault:tech-counts:{owner_key(user_id, session_key)}'
+
+
+def stats_key(user_id, session_key=None):
+    return f'vault:stats:{owner_key(user_id, session_key)}'
+
+
+def tech_counts(user, session_key=None):
+    """
+    Distinct technologies in the visitor's vault with project counts
+    """
+    if not user.is_authenticated and not session_key:
+        return []  # A visitor without a session has no demo projects
+
+    key = tech_counts_key(user.pk, session_key)
+    counts = cache.get(key)
+    if counts is None:
+        projects = Project.objects.visible_to(user, session_key)
+        counts = list(Technology.objects.counts_for(projects))
+        cache.set(key, counts, CACHE_TIMEOUT)
+    return counts
+
+
+def project_stats(user, session_key=None):
+    """
+    Counts by status, difficulty and priority plus the top technologies
+    """
+    key = stats_key(user.pk, session_key)
+    stats = cache.get(key)
+    if stats is None:
+        stats = Project.objects.visible_to(user, session_key).breakdown()
+        stats['top_technologies'] = tech_counts(user, session_key)[:TOP_TECHNOLOGIES]
+        if user.is_authenticated or session_key:
+            cache.set(key, stats, CACHE_TIMEOUT)
+    return stats
+
+
+def invalidate_owner(user_id, session_key=None):
+    keys = [tech_counts_key(user_id, session_key), stats_key(user_id, session_key)]
+    cache.delete_many(keys)
+    # Inside a transaction, a concurrent request can still read the rows
+    # as they were and cache them again; drop those once the write commits
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(keys))
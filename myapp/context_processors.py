@@ -0,0 +1,8 @@
+from django.conf import settings
+
+
+def card_template_version(request):
+    """
+    Version of project_card.html, part of its fragment cache key
+    """
+    return {'CARD_TEMPLATE_VERSION': settings.CARD_TEMPLATE_VERSION}
@@ -0,0 +1,134 @@
+"""
+Expiry of demo-mode projects.
+
+Anonymous visitors only see demo projects younger than DEMO_PROJECT_TTL,
+the rows themselves are deleted later, in batches, by the
+purge_demo_projects management command or the optional background thread.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+def demo_cutoff(ttl=None):
+    """
+    Demo projects created before this moment have expired
+    """
+    if ttl is None:
+        ttl = settings.DEMO_PROJECT_TTL
+    return timezone.now() - timedelta(seconds=ttl)
+
+
+class PurgeLocked(Exception):
+    pass
+
+
+@contextmanager
+def purge_lock(path=None):
+    """
+    Hold an exclusive, non-blocking lock on a file so only one purge runs at a time,
+    across threads, processes and cron. Raises PurgeLocked if it is taken.
+    """
+    path = path or settings.DEMO_PURGE_LOCK_FILE
+    handle = open(path, 'a+')
+    try:
+        try:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            raise PurgeLocked(f'Another purge holds {path}')
+        yield
+    finally:
+        handle.close()  # Closing the file releases the lock
+
+
+def purge_expired_demo_projects(ttl=None, batch_size=None, max_batches=None):
+    """
+    Delete expired demo projects in batches of ``batch_size``, each in its own
+    short transaction so writers are never blocked for long. Returns the number
+    of projects deleted.
+    """
+    from .models import Project, write_atomic
+
+    batch_size = batch_size or settings.DEMO_PURGE_BATCH_SIZE
+    expired = Project.objects.filter(user__isnull=True, created_at__lt=demo_cutoff(ttl))
+
+    deleted = batches = 0
+    while max_batches is None or batches < max_batches:
+        # Walks the partial index on created_at for demo rows
+        ids = list(expired.order_by('created_at').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            break
+        # Cached per-session aggregates are dropped by the post_delete signal.
+        # The delete collects the related rows before it writes.
+        with write_atomic():
+            Project.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+        batches += 1
+    return deleted
+
+
+def _purge_forever(interval):
+    while True:
+        time.sleep(interval)
+        close_old_connections()
+        try:
+            with purge_lock():
+                deleted = purge_expired_demo_projects()
+            if deleted:
+                logger.info('Purged %d expired demo projects', deleted)
+        except PurgeLocked:
+            pass
+        except Exception:
+            logger.exception('Demo project purge failed')
+        finally:
+            close_old_connections()
+
+
+def start_purge_thread(interval=None):
+    """
+    Run the purge every ``interval`` seconds in a daemon thread of this process
+    """
+    interval = interval or settings.DEMO_PURGE_INTERVAL
+    thread = threading.Thread(
+        target=_purge_forever, args=(interval,), name='demo-purge', daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+_purge_thread_pid = None
+_purge_thread_lock = threading.Lock()
+
+
+def ensure_purge_thread(**kwargs):
+    """
+    request_started receiver: start this process's purge thread on its first
+    request. Only processes that serve requests run one, not the gunicorn
+    master or management commands, and forked workers start their own
+    (threads do not survive a fork).
+    """
+    global _purge_thread_pid
+    if _purge_thread_pid == os.getpid():
+        return
+    with _purge_thread_lock:
+        if _purge_thread_pid != os.getpid():
+            start_purge_thread()
+            _purge_thread_pid = os.getpid()
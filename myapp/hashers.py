@@ -0,0 +1,40 @@
+"""
+Password hashers with their cost taken from settings.
+
+They keep the algorithm names of Django's hashers, so hashes made by the
+stock hashers still verify, and replace them in settings.PASSWORD_HASHERS.
+When a cost setting changes, must_update()
+reports existing hashes as outdated and they are upgraded on the user's
+next login (see backends.PooledModelBackend).
+"""
+import base64
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    work_factor = settings.SCRYPT_WORK_FACTOR
+    block_size = settings.SCRYPT_BLOCK_SIZE
+    parallelism = settings.SCRYPT_PARALLELISM
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        self._check_encode_args(password, salt)
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        # scrypt needs 128 * n * r bytes, more than OpenSSL's 32 MiB default
+        # above n=2**14. Sized from the hash's own cost, so hashes made at a
+        # higher cost than the current settings still verify.
+        hash_ = hashlib.scrypt(
+            password.encode(), salt=salt.encode(), n=n, r=r, p=p, maxmem=256 * n * r, dklen=64,
+        )
+        hash_ = base64.b64encode(hash_).decode('ascii').strip()
+        return '%s$%d$%s$%d$%d$%s' % (self.algorithm, n, salt, r, p, hash_)
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    time_cost = settings.ARGON2_TIME_COST
+    memory_cost = settings.ARGON2_MEMORY_COST
+    parallelism = settings.ARGON2_PARALLELISM
@@ -0,0 +1,168 @@
+"""
+Project history, written off the request path.
+
+The views describe each create, edit and delete with record(), which only
+puts a ProjectEvent on an in-process queue of at most HISTORY_QUEUE_SIZE
+events; when it is full, new events are dropped (and counted) rather than
+slowing requests down. A daemon thread per process writes the queue with
+bulk_create in batches of up to HISTORY_BATCH_SIZE, waiting at most
+HISTORY_FLUSH_INTERVAL seconds for a batch to fill. Whatever is still
+queued when the process exits is written by an atexit handler. Events are
+lost only if a process is killed, or when the queue overflows.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import ProjectEvent
+
+logger = logging.getLogger(__name__)
+
+
+class HistoryWriter:
+    def __init__(self, queue_size, batch_size, interval):
+        self.queue = queue.Queue(queue_size)
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self.stopping = threading.Event()
+        self.thread = None
+
+    def put(self, event):
+        """
+        Queue ``event`` without blocking, False if it was dropped
+        """
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning('History queue is full, %d events dropped so far', self.dropped)
+            return False
+        return True
+
+    def next_batch(self):
+        """
+        Wait for an event, then up to ``interval`` seconds for the batch to fill
+        """
+        try:
+            batch = [self.queue.get(timeout=self.interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.interval
+        while len(batch) < self.batch_size and not self.stopping.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def write(self, events):
+        close_old_connections()
+        try:
+            ProjectEvent.objects.bulk_create(events, batch_size=self.batch_size)
+        except Exception:
+            logger.exception('Could not write %d history events', len(events))
+            return 0
+        return len(events)
+
+    def run(self):
+        while not self.stopping.is_set():
+            batch = self.next_batch()
+            if batch:
+                self.write(batch)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name='history-writer', daemon=True)
+        self.thread.start()
+
+    def flush(self):
+        """
+        Write everything queued from the calling thread, returns the number written
+        """
+        written = 0
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return written
+            written += self.write(batch)
+
+    def stop(self, timeout=None):
+        """
+        Let the thread finish its batch, then write what is left
+        """
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join(self.interval + 5 if timeout is None else timeout)
+        return self.flush()
+
+
+_writer = None
+_writer_pid = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """
+    The writer of the current process, started on first use (threads do not
+    survive a fork). With HISTORY_FLUSH_INTERVAL 0 no thread is started and
+    events stay queued until flush().
+    """
+    global _writer, _writer_pid
+    with _writer_lock:
+        if _writer is None or _writer_pid != os.getpid():
+            _writer = HistoryWriter(
+                settings.HISTORY_QUEUE_SIZE, settings.HISTORY_BATCH_SIZE, settings.HISTORY_FLUSH_INTERVAL,
+            )
+            _writer_pid = os.getpid()
+            if settings.HISTORY_FLUSH_INTERVAL > 0:
+                _writer.start()
+        return _writer
+
+
+def flush():
+    return get_writer().flush()
+
+
+@atexit.register
+def shutdown():
+    # Forked workers inherit the handler, not the writer
+    if _writer is not None and _writer_pid == os.getpid():
+        written = _writer.stop()
+        if written:
+            logger.info('Wrote %d queued history events on exit', written)
+
+
+def record(kind, project_id, user_id=None, session_key=None, changes=None):
+    """
+    Queue one ProjectEvent; never blocks and never touches the database
+    """
+    if not settings.HISTORY_ENABLED:
+        return False
+    return get_writer().put(ProjectEvent(
+        project_id=project_id,
+        user_id=user_id,
+        session_key=session_key,
+        kind=kind,
+        changes=changes or {},
+        created_at=timezone.now(),
+    ))
+
+
+def record_project(kind, project, changes=None):
+    return record(kind, project.pk, project.user_id, project.session_key, changes)
@@ -0,0 +1,32 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from myapp.transfer import BATCH_SIZE, FORMATS, import_projects
+
+
+class Command(BaseCommand):
+    help = 'Import projects for a user from an NDJSON or CSV export'
+
+    def add_arguments(self, parser):
+        parser.add_argument('username')
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help='Default: guessed from the file extension')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f'User "{options["username"]}" does not exist')
+
+        fmt = options['format'] or ('csv' if options['path'].endswith('.csv') else 'ndjson')
+        with open(options['path'], encoding='utf-8', newline='') as lines:
+            result = import_projects(lines, fmt, user, batch_size=options['batch_size'])
+
+        for error in result['errors']:
+            self.stderr.write(f"line {error['line']}: {error['message']}")
+        summary = f"Imported {result['created']} project(s), rejected {result['rejected']}"
+        stopped = result['stopped']
+        if stopped:
+            raise CommandError(f"{stopped['message']}. Stopped after line {stopped['after_line']}. {summary}")
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,36 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from myapp.middleware import perf_report, reset_perf_report
+
+
+class Command(BaseCommand):
+    help = 'Show per-view latency and query percentiles collected by PerformanceMiddleware'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', action='store_true', help='Print the raw report as JSON')
+        parser.add_argument('--reset', action='store_true', help='Clear the collected samples afterwards')
+
+    def handle(self, *args, **options):
+        report = perf_report()
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        elif not report:
+            self.stdout.write('No samples collected (is PERF_INSTRUMENTATION on, with a shared cache?)')
+        else:
+            self.stdout.write(
+                f"{'view':<32}{'requests':>9}{'total p50/p95/p99 ms':>26}{'db p95 ms':>11}"
+                f"{'tpl p95 ms':>12}{'queries p95':>13}{'dup':>6}"
+            )
+            for view, stats in report.items():
+                total = stats['total_ms']
+                self.stdout.write(
+                    f"{view:<32}{stats['requests']:>9}"
+                    f"{total['p50']:>10}/{total['p95']}/{total['p99']:<8}"
+                    f"{stats['db_ms']['p95']:>11}{stats['template_ms']['p95']:>12}"
+                    f"{stats['queries']['p95']:>13}{stats['duplicate_requests']:>6}"
+                )
+
+        if options['reset']:
+            reset_perf_report()
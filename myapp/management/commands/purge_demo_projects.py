@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from myapp.demo import PurgeLocked, purge_expired_demo_projects, purge_lock
+
+
+class Command(BaseCommand):
+    help = 'Delete expired demo-mode projects in bounded batches (safe to run from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ttl', type=int, default=settings.DEMO_PROJECT_TTL,
+            help='Age in seconds after which a demo project expires (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=settings.DEMO_PURGE_BATCH_SIZE,
+            help='Projects deleted per transaction (default: %(default)s)',
+        )
+        parser.add_argument(
+            '--max-batches', type=int, default=None,
+            help='Stop after this many batches (default: until nothing is left)',
+        )
+
+    def handle(self, *args, **options):
+        if options['ttl'] < 0 or options['batch_size'] < 1:
+            raise CommandError('--ttl must be >= 0 and --batch-size >= 1')
+
+        try:
+            with purge_lock():
+                deleted = purge_expired_demo_projects(
+                    ttl=options['ttl'],
+                    batch_size=options['batch_size'],
+                    max_batches=options['max_batches'],
+                )
+        except PurgeLocked as e:
+            self.stderr.write(f'Skipped: {e}')
+            return
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired demo project(s)'))
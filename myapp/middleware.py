@@ -0,0 +1,191 @@
+"""
+Opt-in request instrumentation (PERF_INSTRUMENTATION = True).
+
+For every request the middleware records the number of SQL queries, the
+time spent in the database, in template rendering and in total. These are
+returned as a Server-Timing header and kept as a rolling window of samples
+per view in the cache, one key per sample so concurrent workers do not
+overwrite each other's, see perf_report(). Repeated identical queries (the
+N+1 pattern) are flagged in an X-Duplicate-Queries header and logged.
+"""
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar('perf_metrics', default=None)
+
+VIEWS_KEY = 'perf:views'
+
+
+def _count_key(view):
+    return f'perf:count:{view}'
+
+
+def _sample_key(view, slot):
+    return f'perf:samples:{view}:{slot}'
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = Counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.query_count += 1
+            # Parameters are passed separately, so the same statement with
+            # different values counts as a repeat
+            self.queries[sql] += 1
+
+    def duplicates(self, threshold):
+        return {sql: count for sql, count in self.queries.items() if count >= threshold}
+
+
+def _install_template_timer():
+    """
+    Time top-level template renders (includes are part of their parent render)
+    """
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, 'perf_timed', False):
+        return
+    render = Template.render
+
+    def timed_render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return render(self, context, request)
+        start = time.perf_counter()
+        try:
+            return render(self, context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - start
+
+    timed_render.perf_timed = True
+    Template.render = timed_render
+
+
+def _cache():
+    return caches[settings.PERF_CACHE_ALIAS]
+
+
+def record_sample(view, sample):
+    """
+    Store a sample in the rolling window of ``view``, a ring of PERF_WINDOW
+    keys. The slot comes from an incr() of the view's request count.
+    """
+    cache = _cache()
+    count_key = _count_key(view)
+    cache.add(count_key, 0, None)
+    count = cache.incr(count_key)
+    if type(cache).incr is BaseCache.incr:
+        # The generic incr() (file, database caches) sets the default timeout
+        cache.touch(count_key, None)
+    cache.set(_sample_key(view, (count - 1) % settings.PERF_WINDOW), sample, None)
+
+    # Checked on every sample, so a view lost to a concurrent update of the
+    # set is added back by its next request
+    views = cache.get(VIEWS_KEY) or set()
+    if view not in views:
+        cache.set(VIEWS_KEY, views | {view}, None)
+
+
+def _samples(cache, view):
+    count = cache.get(_count_key(view)) or 0
+    slots = range(min(count, settings.PERF_WINDOW))
+    return list(cache.get_many([_sample_key(view, slot) for slot in slots]).values())
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def perf_report():
+    """
+    p50/p95/p99 of every metric for each instrumented view
+    """
+    cache = _cache()
+    report = {}
+    for view in sorted(cache.get(VIEWS_KEY) or ()):
+        samples = _samples(cache, view)
+        if not samples:
+            continue
+        report[view] = {'requests': len(samples)}
+        for metric in ('total_ms', 'db_ms', 'template_ms', 'queries'):
+            values = [sample[metric] for sample in samples]
+            report[view][metric] = {
+                f'p{pct}': round(_percentile(values, pct), 2) for pct in (50, 95, 99)
+            }
+        report[view]['duplicate_requests'] = sum(1 for sample in samples if sample['duplicates'])
+    return report
+
+
+def reset_perf_report():
+    cache = _cache()
+    views = cache.get(VIEWS_KEY) or ()
+    keys = [VIEWS_KEY]
+    for view in views:
+        keys += [_count_key(view)] + [_sample_key(view, slot) for slot in range(settings.PERF_WINDOW)]
+    cache.delete_many(keys)
+
+
+class PerformanceMiddleware:
+    def __init__(self, get_response):
+        if not settings.PERF_INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        _install_template_timer()
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = time.perf_counter() - start
+
+        match = request.resolver_match
+        view = match.view_name if match else request.path
+        duplicates = metrics.duplicates(settings.PERF_DUPLICATE_THRESHOLD)
+
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.query_count} queries"',
+            f'tpl;dur={metrics.template_time * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ])
+        if duplicates:
+            response['X-Duplicate-Queries'] = str(sum(duplicates.values()))
+            sql, count = max(duplicates.items(), key=lambda item: item[1])
+            logger.warning('%s ran the same query %d times: %s', view, count, sql)
+
+        record_sample(view, {
+            'total_ms': total * 1000,
+            'db_ms': metrics.db_time * 1000,
+            'template_ms': metrics.template_time * 1000,
+            'queries': metrics.query_count,
+            'duplicates': len(duplicates),
+        })
+        return response
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0003_alter_project_user'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='Features',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='project_user_created_idx'),
+        ),
+    ]
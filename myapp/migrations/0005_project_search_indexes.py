@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:42
+
+from django.db import migrations, models
+
+from myapp import search
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0004_project_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='project_user_status_idx'),
+        ),
+        migrations.RunPython(search.install, search.uninstall),
+    ]
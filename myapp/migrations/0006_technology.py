@@ -0,0 +1,34 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0005_project_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('key', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name_plural': 'technologies',
+            },
+        ),
+        migrations.AddField(
+            model_name='techstack',
+            name='technology',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='project_links', to='myapp.technology'),
+        ),
+        # A default lets 0008 be reversed: name is re-added before restore_names runs
+        migrations.AlterField(
+            model_name='techstack',
+            name='name',
+            field=models.CharField(default='', max_length=100),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+
+def clean_tech_name(name):
+    return ' '.join(name.split())
+
+
+def link_technologies(apps, schema_editor):
+    """
+    Point every TechStack row at a canonical Technology, dropping rows that
+    duplicate a technology already linked to the same project
+    """
+    Technology = apps.get_model('myapp', 'Technology')
+    TechStack = apps.get_model('myapp', 'TechStack')
+
+    names = {}
+    links = {}
+    linked = set()
+    duplicates = []
+    rows = TechStack.objects.order_by('id').values_list('id', 'project_id', 'name')
+    for pk, project_id, name in rows.iterator(chunk_size=2000):
+        name = clean_tech_name(name)
+        key = name.casefold()
+        if not key or (project_id, key) in linked:
+            duplicates.append(pk)
+            continue
+        names.setdefault(key, name)
+        links.setdefault(key, []).append(pk)
+        linked.add((project_id, key))
+
+    # Keep IN lists well below SQLite's bound-parameter limit
+    for start in range(0, len(duplicates), 500):
+        TechStack.objects.filter(pk__in=duplicates[start:start + 500]).delete()
+    Technology.objects.bulk_create([Technology(key=key, name=name) for key, name in names.items()], batch_size=500)
+    for technology in Technology.objects.all():
+        pks = links[technology.key]
+        for start in range(0, len(pks), 500):
+            TechStack.objects.filter(pk__in=pks[start:start + 500]).update(technology=technology)
+
+
+def restore_names(apps, schema_editor):
+    TechStack = apps.get_model('myapp', 'TechStack')
+    for tech in TechStack.objects.select_related('technology').iterator(chunk_size=2000):
+        TechStack.objects.filter(pk=tech.pk).update(name=tech.technology.name)
+
+
+class Migration(migrations.Migration):
+    # Data only: on PostgreSQL the updates leave deferred foreign key checks
+    # pending until commit, and ALTER TABLE on myapp_techstack in the same
+    # transaction fails. The schema changes before and after are separate
+    # migrations, and so separate transactions.
+
+    dependencies = [
+        ('myapp', '0006_technology'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_technologies, restore_names),
+    ]
@@ -0,0 +1,40 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0007_link_technologies'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='techstack',
+            name='name',
+        ),
+        migrations.AlterField(
+            model_name='techstack',
+            name='technology',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='project_links', to='myapp.technology'),
+        ),
+        migrations.AddConstraint(
+            model_name='techstack',
+            constraint=models.UniqueConstraint(fields=('project', 'technology'), name='techstack_unique_technology'),
+        ),
+        migrations.AddIndex(
+            model_name='techstack',
+            index=models.Index(fields=['technology', 'project'], name='techstack_technology_idx'),
+        ),
+        # The through table already exists; adding the field for real would make
+        # SQLite remake myapp_project and drop the full-text search triggers
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name='project',
+                    name='technologies',
+                    field=models.ManyToManyField(related_name='projects', through='myapp.TechStack', to='myapp.technology'),
+                ),
+            ],
+        ),
+    ]
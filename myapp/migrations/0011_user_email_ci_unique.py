@@ -0,0 +1,45 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+# Case-insensitive unique email on auth_user. Blank emails (e.g. superusers
+# created without one) are left out of the index. Registration looks emails
+# up with LOWER(email) = %s AND email > '', which this index serves.
+CREATE_INDEX = "CREATE UNIQUE INDEX auth_user_email_ci_uniq ON auth_user (LOWER(email)) WHERE email > ''"
+DROP_INDEX = 'DROP INDEX auth_user_email_ci_uniq'
+
+# Expression and partial indexes are supported by both backends in use
+VENDORS = ('sqlite', 'postgresql')
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in VENDORS:
+        return
+    User = apps.get_model('auth', 'User')
+    duplicates = list(
+        User.objects.exclude(email='').values(email_ci=Lower('email'))
+        .annotate(users=Count('id')).filter(users__gt=1).values_list('email_ci', flat=True)[:10]
+    )
+    if duplicates:
+        raise RuntimeError(
+            'Several users share these emails (ignoring case), change them before migrating: '
+            + ', '.join(duplicates)
+        )
+    schema_editor.execute(CREATE_INDEX)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor in VENDORS:
+        schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('myapp', '0010_project_session_key'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
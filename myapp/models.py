@@ -1,8 +1,100 @@
-from django.db import models
+from contextlib import contextmanager
+
+from django.db import models, transaction
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 # Create your models here.
 
+@contextmanager
+def write_atomic(using=None):
+    """
+    transaction.atomic() for blocks that read before they write. On SQLite
+    the outermost block begins IMMEDIATE (see mysite/sqlite_backend), so it
+    waits for the write lock instead of failing with "database is locked"
+    when another connection commits between its read and its write.
+    """
+    connection = transaction.get_connection(using)
+    connection.begin_immediate = True
+    try:
+        with transaction.atomic(using=using):
+            connection.begin_immediate = False  # Nested blocks and later transactions begin as usual
+            yield
+    finally:
+        connection.begin_immediate = False
+
+def clean_tech_name(name):
+    """
+    Display form of a technology name: trimmed, inner whitespace collapsed
+    """
+    return ' '.join(name.split())
+
+def tech_key(name):
+    """
+    Canonical form used to deduplicate technologies ("Django", " django ", "DJANGO")
+    """
+    return clean_tech_name(name).casefold()
+
+def tech_prefetch():
+    """
+    Prefetch of a project's tech items with their technology, in creation order
+    """
+    return Prefetch('tech_items', queryset=TechStack.objects.select_related('technology').order_by('id'))
+
+class ProjectQuerySet(models.QuerySet):
+    def visible_to(self, user, session_key=None):
+        """
+        Projects owned by ``user``, or for anonymous visitors the demo
+        projects created in their session
+        """
+        if user.is_authenticated:
+            return self.filter(user=user)
+        if not session_key:
+            return self.none()
+        # Expired demo projects stay hidden until the purge deletes them
+        from .demo import demo_cutoff
+        return self.filter(user__isnull=True, session_key=session_key, created_at__gte=demo_cutoff())
+
+    def with_tech(self):
+        """
+        Load the tech stack of every project in one extra query
+        instead of one query per card
+        """
+        return self.prefetch_related(tech_prefetch())
+
+    def matching(self, status=None, difficulty=None, priority=None, tech=None, text=None):
+        """
+        Apply the listing filters; empty values are ignored
+        """
+        from .search import fulltext_filter
+
+        filters = {'status': status, 'difficulty': difficulty, 'priority': priority}
+        queryset = self.filter(**{field: value for field, value in filters.items() if value})
+        if tech:
+            queryset = queryset.filter(Exists(
+                TechStack.objects.filter(project=OuterRef('pk'), technology__key=tech_key(tech))
+            ))
+        return fulltext_filter(queryset, text)
+
+    def breakdown(self):
+        """
+        Project counts by status, difficulty and priority from a single grouped query
+        """
+        stats = {'total': 0, 'status': {}, 'difficulty': {}, 'priority': {}}
+        rows = self.order_by().values('status', 'difficulty', 'priority').annotate(count=Count('id'))
+        for row in rows:
+            stats['total'] += row['count']
+            for field in ('status', 'difficulty', 'priority'):
+                stats[field][row[field]] = stats[field].get(row[field], 0) + row['count']
+        
+        # Counters shown in the stats bar
+        stats['in_progress'] = stats['status'].get('in-progress', 0)
+        stats['completed'] = stats['status'].get('completed', 0)
+        stats['high_priority'] = stats['priority'].get('high', 0)
+        return stats
+
+
 class Project(models.Model):
     # Basic fields
     title = models.CharField(max_length=200)
@@ -41,14 +133,170 @@ class Project(models.Model):
     
     # User relationship
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='projects', null=True, blank=True)
+    # Session of the anonymous visitor who created a demo project
+    session_key = models.CharField(max_length=40, null=True, blank=True)
+    
+    # Technologies, linked through the TechStack rows
+    technologies = models.ManyToManyField('Technology', through='TechStack', related_name='projects')
+    
+    objects = ProjectQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            # Keyset pagination walks (created_at, id) backwards per owner
+            models.Index(fields=['user', '-created_at', '-id'], name='project_user_created_idx'),
+            # Status filter on the listing and search endpoints
+            models.Index(fields=['user', 'status', '-created_at'], name='project_user_status_idx'),
+            # Demo expiry scans only the anonymous rows
+            models.Index(fields=['created_at'], condition=Q(user__isnull=True), name='project_demo_created_idx'),
+            # Demo listing: one visitor's projects, newest first
+            models.Index(fields=['session_key', '-created_at', '-id'], name='project_session_created_idx'),
+            # Admin changelist: newest first across all owners, and its filters
+            models.Index(fields=['-created_at', '-id'], name='project_created_idx'),
+            models.Index(fields=['status', '-created_at'], name='project_status_created_idx'),
+            models.Index(fields=['difficulty', '-created_at'], name='project_difficulty_created_idx'),
+            models.Index(fields=['priority', '-created_at'], name='project_priority_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
+    
+    def set_tech_stack(self, names, is_new=False):
+        """
+        Make the tech stack match ``names``, touching only the rows that changed.
+        Returns the (added, removed) lists of names.
+        """
+        wanted = {}
+        for name in names:
+            name = clean_tech_name(name)
+            if name:  # Only keep non-empty, unique tech items
+                wanted.setdefault(tech_key(name), name)
+        
+        # Diffed inside the write transaction, so a concurrent edit cannot
+        # change the rows between the read and the write
+        with write_atomic():
+            # A project that was just created has no rows to diff against
+            existing = {} if is_new else {
+                tech.technology.key: tech for tech in self.tech_items.select_related('technology')
+            }
+            removed = [existing[key] for key in existing if key not in wanted]
+            added = [name for key, name in wanted.items() if key not in existing]
+            if removed:
+                stale = TechStack.objects.filter(pk__in=[tech.pk for tech in removed])
+                stale.invalidates_owners = True  # Done below, see signals.tech_stack_changed
+                stale.delete()
+            if added:
+                technologies = Technology.objects.resolve(added)
+                TechStack.objects.bulk_create([
+                    TechStack(project=self, technology=technologies[tech_key(name)]) for name in added
+                ])
+        
+        if added or removed:
+            # Drop a stale prefetched tech list
+            getattr(self, '_prefetched_objects_cache', {}).pop('tech_items', None)
+            # bulk_create sends no post_save signal, so invalidate by hand
+            from .caching import invalidate_owner
+            invalidate_owner(self.user_id, self.session_key)
+        return added, [tech.name for tech in removed]
+
+class TechnologyManager(models.Manager):
+    def resolve(self, names):
+        """
+        Return {key: Technology} for ``names``, creating the missing ones in bulk
+        """
+        by_key = {}
+        for name in names:
+            by_key.setdefault(tech_key(name), clean_tech_name(name))
+        
+        found = {tech.key: tech for tech in self.filter(key__in=by_key)}
+        missing = [Technology(key=key, name=name) for key, name in by_key.items() if key not in found]
+        if missing:
+            # Another request may create the same technology concurrently
+            self.bulk_create(missing, ignore_conflicts=True)
+            found.update((tech.key, tech) for tech in self.filter(key__in=[tech.key for tech in missing]))
+        return found
+    
+    def counts_for(self, projects):
+        """
+        Distinct technologies used by ``projects`` with the number of projects using each
+        """
+        return (
+            self.filter(project_links__project__in=projects)
+            .annotate(count=Count('project_links'))
+            .order_by('-count', 'name')
+            .values('name', 'count')
+        )
+
+class Technology(models.Model):
+    # First spelling we saw, shown in the UI
+    name = models.CharField(max_length=100)
+    # Normalized spelling, one row per technology
+    key = models.CharField(max_length=100, unique=True)
+    
+    objects = TechnologyManager()
+    
+    class Meta:
+        verbose_name_plural = 'technologies'
+    
+    def __str__(self):
+        return self.name
 
 class TechStack(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='tech_items')
-    name = models.CharField(max_length=100)
+    technology = models.ForeignKey(Technology, on_delete=models.PROTECT, related_name='project_links')
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'technology'], name='techstack_unique_technology'),
+        ]
+        indexes = [
+            # Tech filter: projects using a technology
+            models.Index(fields=['technology', 'project'], name='techstack_technology_idx'),
+        ]
+    
+    @property
+    def name(self):
+        return self.technology.name
     
     def __str__(self):
         return self.name
 
+class ProjectEvent(models.Model):
+    """
+    One entry of a project's history, queued by the views and written in
+    batches by myapp.history
+    """
+    CREATED = 'created'
+    UPDATED = 'updated'
+    DELETED = 'deleted'
+    KIND_CHOICES = [
+        (CREATED, 'Created'),
+        (UPDATED, 'Updated'),
+        (DELETED, 'Deleted'),
+    ]
+    
+    # No database constraints: events outlive their project and owner, and are
+    # inserted after the request, when either may already be gone. The
+    # project is indexed by projectevent_project_idx below.
+    project = models.ForeignKey(
+        Project, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, related_name='events',
+    )
+    user = models.ForeignKey(
+        User, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False,
+        null=True, blank=True, related_name='+',
+    )
+    session_key = models.CharField(max_length=40, null=True, blank=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    # {field: [old, new]}, plus {"tech_stack": {"added": [...], "removed": [...]}}
+    changes = models.JSONField(default=dict, blank=True)
+    # When the change happened, not when it was written
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        indexes = [
+            # A project's history, newest first
+            models.Index(fields=['project', '-created_at'], name='projectevent_project_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.get_kind_display()} project {self.project_id}'
@@ -0,0 +1,131 @@
+import base64
+import binascii
+from datetime import datetime
+
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+# Number of project cards rendered per page
+PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+# Below this many rows an exact COUNT(*) is cheap enough
+ESTIMATE_THRESHOLD = 100_000
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(project):
+    """
+    Encode the (created_at, id) position of a project as an opaque token
+    """
+    raw = f'{project.created_at.isoformat()}|{project.pk}'
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Decode a token produced by encode_cursor back into (created_at, id)
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, pk = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def parse_page_size(value):
+    """
+    Clamp a requested page size to 1..MAX_PAGE_SIZE, defaulting to PAGE_SIZE
+    """
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return PAGE_SIZE
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def after_cursor(queryset, cursor=None):
+    """
+    ``queryset`` newest first, starting strictly after the ``cursor`` position
+    """
+    queryset = queryset.order_by('-created_at', '-id')
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+    return queryset
+
+
+def split_page(items, size):
+    """
+    (page, next cursor) from the ``size + 1`` rows fetched for a page
+    """
+    next_cursor = encode_cursor(items[size - 1]) if len(items) > size else None
+    return items[:size], next_cursor
+
+
+def keyset_page(queryset, cursor=None, size=PAGE_SIZE):
+    """
+    Return one page of ``queryset`` (newest first) and the cursor of the next page.
+
+    Instead of OFFSET, rows are selected strictly after the (created_at, id)
+    of the last row of the previous page, so every page costs the same
+    indexed range scan no matter how deep the client has scrolled.
+    """
+    # Fetch one extra row to know whether another page exists
+    return split_page(list(after_cursor(queryset, cursor)[:size + 1]), size)
+
+
+async def akeyset_page(queryset, cursor=None, size=PAGE_SIZE):
+    """
+    Async version of keyset_page
+    """
+    return split_page([item async for item in after_cursor(queryset, cursor)[:size + 1]], size)
+
+
+def estimated_count(model, using='default'):
+    """
+    Row count of ``model``'s table from the planner statistics (kept up to
+    date by autovacuum on PostgreSQL, by ANALYZE on SQLite), or None
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+            elif connection.vendor == 'sqlite':
+                cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1', [table])
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None  # sqlite_stat1 only exists once ANALYZE has run
+    if not row:
+        return None
+    count = int(str(row[0]).split()[0])
+    return count if count >= 0 else None  # -1 means never analyzed
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for the admin that avoids COUNT(*) over a whole large table.
+    An unfiltered queryset is counted from the planner statistics once the
+    table holds ESTIMATE_THRESHOLD rows; filtered ones are counted exactly.
+    """
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, 'query') and not queryset.query.where:
+            estimate = estimated_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
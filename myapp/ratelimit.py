@@ -0,0 +1,165 @@
+"""
+Cache-backed admission control for the write and authentication endpoints.
+
+settings.RATELIMITS maps a scope (one or more views) to the rates allowed
+per client, keyed by client IP, session cookie or submitted username:
+
+    'login': {'ip': '30/m', 'username': '10/m'}
+
+Requests are counted in fixed windows of one period. Each request adds
+one to its window's counter with cache.add() and incr(), and is admitted
+if no counter went over its limit; the counters of a rejected request are
+decremented again. incr() is atomic on locmem and redis, so concurrent
+requests cannot all be admitted on the same count. A rejected request
+costs a few cache operations and never reaches the session store, the
+database or the password hasher. Counters live in the
+RATELIMIT_CACHE_ALIAS cache; with several workers it must be shared (file
+or redis) for the limits to hold across processes.
+"""
+import hashlib
+import math
+import re
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import JsonResponse
+from django.shortcuts import render
+
+PERIODS = {'s': 1, 'm': 60, 'h': 60 * 60, 'd': 24 * 60 * 60}
+# "10/m", "100/h" or "5/30s": requests per (multiple of a) period
+RATE_PATTERN = re.compile(r'^(\d+)/(\d*)([smhd])$')
+
+
+def parse_rate(rate):
+    """
+    (allowed requests, period in seconds)
+    """
+    match = RATE_PATTERN.match(rate)
+    if not match:
+        raise ImproperlyConfigured(f'Invalid rate "{rate}", expected e.g. "10/m" or "5/30s"')
+    count, multiplier, unit = match.groups()
+    return int(count), int(multiplier or 1) * PERIODS[unit]
+
+
+def client_ip(request):
+    # REMOTE_ADDR, or the header a trusted proxy puts the client address in
+    return request.META.get(settings.RATELIMIT_IP_META, '').split(',')[0].strip()
+
+
+def session_cookie(request):
+    # The cookie identifies the visitor without loading the session
+    return request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+
+
+def submitted_username(request):
+    return request.POST.get('username', '').strip().lower()
+
+
+KEY_FUNCTIONS = {
+    'ip': client_ip,
+    'session': session_cookie,
+    'username': submitted_username,
+}
+
+
+def counter_key(scope, kind, value, period, window):
+    digest = hashlib.md5(value.encode(), usedforsecurity=False).hexdigest()
+    return f'ratelimit:{scope}:{kind}:{digest}:{period}:{window}'
+
+
+def count(cache, key, delta, timeout):
+    """
+    Add ``delta`` to the counter ``key``, created to expire in ``timeout``
+    seconds, and return its new value
+    """
+    # A no-op when the window's counter exists, so its expiry is kept
+    cache.add(key, 0, timeout)
+    try:
+        value = cache.incr(key, delta)
+    except ValueError:
+        # Expired between the two calls
+        cache.add(key, delta, timeout)
+        return delta
+    if type(cache).incr is BaseCache.incr:
+        # The generic incr() (file, database caches) is a get() and a set()
+        # with the default timeout, which would move the expiry
+        cache.touch(key, timeout)
+    return value
+
+
+def check(request, scope, now=None):
+    """
+    Count the request against every limit of ``scope``. Returns None when it
+    is admitted, else the number of seconds after which to retry.
+    """
+    now = time.time() if now is None else now
+    limits = []
+    for kind, rate in settings.RATELIMITS.get(scope, {}).items():
+        value = KEY_FUNCTIONS[kind](request)
+        if not value:
+            continue  # No session cookie or username to count by
+        limit, period = parse_rate(rate)
+        window, elapsed = divmod(now, period)
+        limits.append((
+            counter_key(scope, kind, value, period, int(window)),
+            limit, math.ceil(period - elapsed),
+        ))
+    if not limits:
+        return None
+
+    cache = caches[settings.RATELIMIT_CACHE_ALIAS]
+    retry_after = 0
+    for key, limit, remaining in limits:
+        if count(cache, key, 1, remaining) > limit:
+            retry_after = max(retry_after, remaining)
+    if retry_after:
+        # Only admitted requests are counted
+        for key, limit, remaining in limits:
+            count(cache, key, -1, remaining)
+        return retry_after
+    return None
+
+
+def too_many_requests(request, retry_after, template=None):
+    """
+    429 page for form views, 429 JSON for the AJAX endpoints
+    """
+    message = 'Too many requests, please try again in a moment.'
+    if template:
+        messages.error(request, message)
+        response = render(request, template, status=429)
+    else:
+        response = JsonResponse({'success': False, 'message': message}, status=429)
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def ratelimit(scope, methods=('POST',), template=None):
+    """
+    Limit ``methods`` requests to the view by settings.RATELIMITS[scope],
+    answering the excess with too_many_requests() before the view runs
+    """
+    def decorator(view):
+        def limited(request):
+            if not settings.RATELIMIT_ENABLED or request.method not in methods:
+                return None
+            retry_after = check(request, scope)
+            return retry_after and too_many_requests(request, retry_after, template)
+
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def wrapper(request, *args, **kwargs):
+                response = await sync_to_async(limited)(request)
+                return response or await view(request, *args, **kwargs)
+        else:
+            @wraps(view)
+            def wrapper(request, *args, **kwargs):
+                return limited(request) or view(request, *args, **kwargs)
+        return wrapper
+    return decorator
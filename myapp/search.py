@@ -0,0 +1,121 @@
+"""
+Full-text search over project titles and descriptions.
+
+SQLite uses an external-content FTS5 table kept in sync by triggers,
+PostgreSQL uses a GIN index on a tsvector expression. Any other backend
+falls back to a plain substring match.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'myapp_project_fts'
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='myapp_project', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON myapp_project BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON myapp_project BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON myapp_project BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ai',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ad',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_au',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+PG_DOCUMENT = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))"
+
+POSTGRESQL_INSTALL = [
+    f'CREATE INDEX IF NOT EXISTS myapp_project_search_idx ON myapp_project USING GIN ({PG_DOCUMENT})',
+]
+
+POSTGRESQL_UNINSTALL = [
+    'DROP INDEX IF EXISTS myapp_project_search_idx',
+]
+
+
+def install(apps, schema_editor):
+    """
+    Create the full-text index for the current backend (migration helper).
+
+    On SQLite, remaking ``myapp_project`` in a later migration drops the
+    triggers together with the old table, so such a migration must call
+    this again afterwards.
+    """
+    statements = {
+        'sqlite': SQLITE_INSTALL,
+        'postgresql': POSTGRESQL_INSTALL,
+    }.get(schema_editor.connection.vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def uninstall(apps, schema_editor):
+    statements = {
+        'sqlite': SQLITE_UNINSTALL,
+        'postgresql': POSTGRESQL_UNINSTALL,
+    }.get(schema_editor.connection.vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def search_terms(text):
+    """
+    Split user input into plain word tokens, dropping query syntax
+    """
+    return re.findall(r'\w+', text or '')
+
+
+def fulltext_filter(queryset, text):
+    """
+    Restrict ``queryset`` to projects whose title or description contains
+    every word of ``text`` as a prefix (so "djan" matches "Django").
+    """
+    terms = search_terms(text)
+    if not terms:
+        return queryset
+
+    vendor = connection.vendor
+    if vendor == 'sqlite':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (match,)
+        ))
+    if vendor == 'postgresql':
+        query = ' & '.join(f'{term}:*' for term in terms)
+        return queryset.filter(RawSQL(
+            f"{PG_DOCUMENT} @@ to_tsquery('english', %s)", (query,),
+            output_field=BooleanField(),
+        ))
+
+    for term in terms:
+        queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+    return queryset
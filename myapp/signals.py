@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .backends import invalidate_user
+from .caching import invalidate_owner
+from .models import Project, TechStack
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_changed(sender, instance, **kwargs):
+    invalidate_owner(instance.user_id, instance.session_key)
+
+
+@receiver(post_save, sender=TechStack)
+@receiver(post_delete, sender=TechStack)
+def tech_stack_changed(sender, instance, origin=None, **kwargs):
+    # Rows removed by deleting their project are covered by project_changed.
+    # Callers that delete TechStack rows in bulk and invalidate the owners
+    # once themselves (set_tech_stack, the admin) mark the QuerySet with
+    # invalidates_owners, instead of one lookup per row here.
+    if isinstance(origin, Project) or (isinstance(origin, QuerySet) and (
+        origin.model is Project or getattr(origin, 'invalidates_owners', False)
+    )):
+        return
+
+    if TechStack.project.is_cached(instance):
+        project = instance.project
+        invalidate_owner(project.user_id, project.session_key)
+        return
+
+    owner = Project.objects.filter(pk=instance.project_id).values_list('user_id', 'session_key').first()
+    if owner:
+        invalidate_owner(*owner)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def user_changed(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
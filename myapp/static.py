@@ -0,0 +1,79 @@
+"""
+Static files for ASGI deployments.
+
+WhiteNoiseMiddleware (6.6) is synchronous: under ASGI, Django adapts it and
+with it every request to a thread, which also takes the async views of
+async_views.py off the event loop. With ASYNC_VIEWS on, settings leave the
+middleware out and mysite/asgi.py serves static files with StaticFilesASGI
+instead. It looks files up in WhiteNoise's index, so URLs, compression,
+headers and immutable caching are the same, and answers them without
+entering Django; everything else goes to the wrapped application.
+"""
+from asgiref.sync import sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+CHUNK_SIZE = 64 * 1024
+
+
+def request_meta(scope):
+    """
+    The HTTP_* entries of a WSGI environ, which is what WhiteNoise reads
+    """
+    meta = {}
+    for name, value in scope.get('headers', []):
+        key = 'HTTP_' + name.decode('latin1').upper().replace('-', '_')
+        value = value.decode('latin1')
+        meta[key] = f'{meta[key]},{value}' if key in meta else value
+    return meta
+
+
+class StaticFilesASGI:
+    def __init__(self, application, whitenoise=None):
+        self.application = application
+        self.whitenoise = whitenoise or WhiteNoiseMiddleware()
+
+    def find(self, path):
+        if self.whitenoise.autorefresh:
+            return self.whitenoise.find_file(path)
+        return self.whitenoise.files.get(path)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            path = scope['path']
+            root_path = scope.get('root_path', '')
+            if root_path and path.startswith(root_path):
+                path = path[len(root_path):]
+            if self.whitenoise.autorefresh:
+                # Checks the file system, only with DEBUG on
+                static_file = await sync_to_async(self.find, thread_sensitive=False)(path)
+            else:
+                static_file = self.find(path)
+            if static_file is not None:
+                return await self.serve(static_file, scope, send)
+        return await self.application(scope, receive, send)
+
+    @staticmethod
+    async def serve(static_file, scope, send):
+        # Opens the file unless it is a HEAD or 304
+        response = await sync_to_async(static_file.get_response, thread_sensitive=False)(
+            scope['method'], request_meta(scope),
+        )
+        await send({
+            'type': 'http.response.start',
+            'status': int(response.status),
+            'headers': [(key.lower().encode('latin1'), value.encode('latin1')) for key, value in response.headers],
+        })
+        if response.file is None:
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+        read = sync_to_async(response.file.read, thread_sensitive=False)
+        try:
+            chunk = await read(CHUNK_SIZE)
+            while True:
+                following = await read(CHUNK_SIZE) if chunk else b''
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': bool(following)})
+                if not following:
+                    break
+                chunk = following
+        finally:
+            await sync_to_async(response.file.close, thread_sensitive=False)()
@@ -0,0 +1,59 @@
+"""
+Static files storage for production (DEBUG off).
+
+collectstatic minifies the app's own CSS and JS under assets/ when rcssmin
+and rjsmin are installed, then WhiteNoise stores every file under a
+content-hashed name with gzip (and, with Brotli installed, brotli) variants.
+Hashed files are served with a far-future immutable Cache-Control, so
+browsers never request them again until a deploy changes their name.
+"""
+import logging
+
+from django.core.files.base import ContentFile
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+logger = logging.getLogger(__name__)
+
+# Only the app's own files, third-party ones ship minified already
+MINIFY_PREFIX = 'assets/'
+
+
+def minifier(path):
+    """
+    Minify function for ``path``, or None when it is not minified
+    """
+    if not path.startswith(MINIFY_PREFIX) or path.endswith(('.min.css', '.min.js')):
+        return None
+    if path.endswith('.css'):
+        return rcssmin and rcssmin.cssmin
+    if path.endswith('.js'):
+        return rjsmin and rjsmin.jsmin
+    return None
+
+
+class MinifiedManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            if not (rcssmin and rjsmin):
+                logger.warning('Install rcssmin and rjsmin to minify static assets')
+            for path, (storage, source_path) in list(paths.items()):
+                minify = minifier(path)
+                if minify is None:
+                    continue
+                with storage.open(source_path) as source:
+                    minified = minify(source.read().decode())
+                # Replace the copied file, then hash and compress the minified one
+                self.delete(path)
+                self.save(path, ContentFile(minified.encode()))
+                paths[path] = (self, path)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
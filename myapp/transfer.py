@@ -0,0 +1,236 @@
+"""
+Bulk export and import of projects as NDJSON or CSV.
+
+Exports stream rows from a chunked iterator, so memory use does not depend
+on the size of the vault. Imports validate each row and write them in
+bulk_create batches, one transaction per batch. A file that cannot be read
+to the end (bad encoding, broken CSV quoting) stops the import there: the
+rows before it are kept and the result says where it stopped.
+"""
+import csv
+import io
+import json
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import invalidate_owner
+from .models import Project, TechStack, Technology, clean_tech_name, tech_key
+
+FORMATS = ('ndjson', 'csv')
+
+CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+FIELDS = [
+    'title', 'description', 'status', 'difficulty', 'priority',
+    'github_url', 'deployment_url', 'created_at', 'tech_stack',
+]
+
+# Separator of tech names inside a single CSV cell
+CSV_TECH_SEPARATOR = ';'
+
+CHUNK_SIZE = 1000
+BATCH_SIZE = 1000
+# Errors reported back to the caller, the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+def project_rows(projects, chunk_size=CHUNK_SIZE):
+    """
+    Yield one plain dict per project, reading ``chunk_size`` rows at a time
+    """
+    projects = projects.with_tech().order_by('id')
+    for project in projects.iterator(chunk_size=chunk_size):
+        yield {
+            'title': project.title,
+            'description': project.description,
+            'status': project.status,
+            'difficulty': project.difficulty,
+            'priority': project.priority,
+            'github_url': project.github_url or '',
+            'deployment_url': project.deployment_url or '',
+            'created_at': project.created_at.isoformat(),
+            'tech_stack': [tech.name for tech in project.tech_items.all()],
+        }
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+def csv_lines(rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=FIELDS)
+    writer.writeheader()
+    for row in rows:
+        row = dict(row, tech_stack=CSV_TECH_SEPARATOR.join(row['tech_stack']))
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def export_lines(projects, fmt, chunk_size=CHUNK_SIZE):
+    """
+    Serialized export of ``projects`` as an iterator of text chunks
+    """
+    rows = project_rows(projects, chunk_size)
+    return ndjson_lines(rows) if fmt == 'ndjson' else csv_lines(rows)
+
+
+def read_rows(lines, fmt):
+    """
+    Parse NDJSON or CSV text lines into (line number, dict or error message) pairs
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        for row in reader:
+            tech = row.get('tech_stack') or ''
+            row['tech_stack'] = [name for name in tech.split(CSV_TECH_SEPARATOR) if name.strip()]
+            yield reader.line_num, row
+        return
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, f'Invalid JSON: {e}'
+            continue
+        yield number, row if isinstance(row, dict) else 'Expected a JSON object'
+
+
+_url_validator = URLValidator()
+_choices = {
+    'status': {value for value, _ in Project.STATUS_CHOICES},
+    'difficulty': {value for value, _ in Project.DIFFICULTY_CHOICES},
+    'priority': {value for value, _ in Project.PRIORITY_CHOICES},
+}
+_defaults = {'status': 'idea', 'difficulty': 'medium', 'priority': 'medium'}
+
+
+def build_project(row, user):
+    """
+    Validate one imported row, returning (unsaved Project, tech names, created_at).
+    Raises ValidationError with a readable message.
+    """
+    title = str(row.get('title') or '').strip()
+    if not title:
+        raise ValidationError('title is required')
+    if len(title) > Project._meta.get_field('title').max_length:
+        raise ValidationError('title is too long')
+
+    values = {}
+    for field, allowed in _choices.items():
+        value = str(row.get(field) or _defaults[field])
+        if value not in allowed:
+            raise ValidationError(f'invalid {field} "{value}"')
+        values[field] = value
+
+    for field in ('github_url', 'deployment_url'):
+        value = str(row.get(field) or '').strip()
+        if value:
+            _url_validator(value)
+        values[field] = value
+
+    created_at = None
+    if row.get('created_at'):
+        try:
+            created_at = datetime.fromisoformat(str(row['created_at']))
+        except (TypeError, ValueError):
+            raise ValidationError('invalid created_at')
+        if timezone.is_naive(created_at):
+            created_at = timezone.make_aware(created_at, dt_timezone.utc)
+
+    tech_stack = row.get('tech_stack') or []
+    if not isinstance(tech_stack, list):
+        raise ValidationError('tech_stack must be a list')
+    names = [name for name in (clean_tech_name(str(name)) for name in tech_stack) if name]
+    if any(len(name) > Technology._meta.get_field('name').max_length for name in names):
+        raise ValidationError('tech name is too long')
+
+    project = Project(title=title, description=str(row.get('description') or ''), user=user, **values)
+    return project, names, created_at
+
+
+def _write_batch(batch):
+    """
+    Insert one batch of (project, tech names, created_at) in a single transaction
+    """
+    projects = [project for project, _, _ in batch]
+    with transaction.atomic():
+        # Primary keys are returned on PostgreSQL and SQLite 3.35+
+        Project.objects.bulk_create(projects)
+
+        # auto_now_add overwrote created_at, restore the exported timestamps
+        dated = []
+        for project, _, created_at in batch:
+            if created_at:
+                project.created_at = created_at
+                dated.append(project)
+        if dated:
+            Project.objects.bulk_update(dated, ['created_at'])
+
+        technologies = Technology.objects.resolve(
+            name for _, names, _ in batch for name in names
+        )
+        links = []
+        for project, names, _ in batch:
+            keys = dict.fromkeys(tech_key(name) for name in names)
+            links += [TechStack(project=project, technology=technologies[key]) for key in keys]
+        TechStack.objects.bulk_create(links)
+
+
+def import_projects(lines, fmt, user, batch_size=BATCH_SIZE):
+    """
+    Import projects for ``user`` from NDJSON or CSV ``lines``.
+    Returns a dict with the number of projects created, the rejected rows and,
+    when the file could not be read to the end, where the import stopped.
+    """
+    created = rejected = number = 0
+    errors = []
+    batch = []
+    stopped = None
+    rows = read_rows(lines, fmt)
+    while True:
+        try:
+            number, row = next(rows)
+        except StopIteration:
+            break
+        except (UnicodeDecodeError, csv.Error) as e:
+            message = 'File must be UTF-8 encoded' if isinstance(e, UnicodeDecodeError) else f'Invalid CSV: {e}'
+            stopped = {'after_line': number, 'message': message}
+            break
+
+        try:
+            if isinstance(row, str):
+                raise ValidationError(row)
+            batch.append(build_project(row, user))
+        except ValidationError as e:
+            rejected += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({'line': number, 'message': '; '.join(e.messages)})
+            continue
+
+        if len(batch) >= batch_size:
+            _write_batch(batch)
+            created += len(batch)
+            batch = []
+
+    if batch:
+        _write_batch(batch)
+        created += len(batch)
+
+    # Bulk writes send no signals
+    if created:
+        invalidate_owner(user.pk)
+    return {'created': created, 'rejected': rejected, 'errors': errors, 'stopped': stopped}
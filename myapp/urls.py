@@ -1,10 +1,22 @@
+from django.conf import settings
 from django.urls import path 
-from . import views 
+from . import async_views, views 
+
+# Listing, update and delete run as async views when ASYNC_VIEWS is on (ASGI deployments)
+project_views = async_views if settings.ASYNC_VIEWS else views
+
 urlpatterns =[
     path('', views.index , name='index'),
+    path('projects/', project_views.project_list, name='project_list'),
+    path('projects/search/', views.search_projects, name='search_projects'),
+    path('projects/export/', views.export_projects, name='export_projects'),
+    path('projects/import/', views.import_projects, name='import_projects'),
+    path('projects/bulk/', views.bulk_projects, name='bulk_projects'),
+    path('_perf/', views.perf_report_view, name='perf_report'),
     path('register',views.register, name='register'),
     path('login',views.login, name='login'),
     path('logout',views.logout, name='logout'),
-    path('update-project/<int:project_id>/', views.update_project, name='update_project'),
-    path('delete-project/<int:project_id>/', views.delete_project, name='delete_project'),
+    path('add-project/', views.add_project, name='add_project'),
+    path('update-project/<int:project_id>/', project_views.update_project, name='update_project'),
+    path('delete-project/<int:project_id>/', project_views.delete_project, name='delete_project'),
 ]
\ No newline at end of file
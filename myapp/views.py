@@ -1,20 +1,47 @@
 from django.shortcuts import render,redirect, get_object_or_404
-from .models import  Project, TechStack
+from .auth_pool import HashingBusy, hash_password
+from .caching import invalidate_owner, project_stats, tech_counts
+from .history import record, record_project
+from .middleware import perf_report
+from .models import  Project, ProjectEvent, tech_prefetch, write_atomic
+from .pagination import InvalidCursor, keyset_page, parse_page_size
+from .ratelimit import ratelimit
+from . import transfer
 from django.contrib.auth.models import User,auth
+from django.conf import settings
 from django.contrib import messages
-from django.http import JsonResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Q, prefetch_related_objects
+from django.db.models.functions import Lower
+from django.http import JsonResponse, StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition
+import hashlib
+import io
 import json
 import re
 
 # Create your views here.
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# (pattern a password must contain, message when it does not)
+PASSWORD_RULES = [
+    (re.compile(r'[A-Z]'), "Password must contain at least one uppercase letter"),
+    (re.compile(r'[a-z]'), "Password must contain at least one lowercase letter"),
+    (re.compile(r'\d'), "Password must contain at least one digit"),
+    (re.compile(r'[!@#$%^&*(),.?":{}|<>]'), "Password must contain at least one special character"),
+]
+
 def validate_email_format(email):
     """
     Validate email format using regex
     """
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not EMAIL_PATTERN.match(email):
         return False, "Please enter a valid email address"
     
     # Additional checks
@@ -45,20 +72,121 @@ def validate_password_strength(password):
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    if not re.search(r'[A-Z]', password):
-        return False, "Password must contain at least one uppercase letter"
-    
-    if not re.search(r'[a-z]', password):
-        return False, "Password must contain at least one lowercase letter"
-    
-    if not re.search(r'\d', password):
-        return False, "Password must contain at least one digit"
-    
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
-        return False, "Password must contain at least one special character"
+    for pattern, message in PASSWORD_RULES:
+        if not pattern.search(password):
+            return False, message
     
     return True, "Password is strong"
 
+def registration_conflict(username, email):
+    """
+    'Email already used' or 'Username already used' from a single query, or None.
+    Emails compare case-insensitively, like the auth_user_email_ci_uniq index
+    (migration 0009) that serves the lookup.
+    """
+    taken = list(
+        User.objects.annotate(email_ci=Lower('email'))
+        .filter(Q(email_ci=email.lower(), email__gt='') | Q(username=username))
+        .values_list('email_ci', flat=True)[:2]
+    )
+    if not taken:
+        return None
+    return 'Email already used' if email.lower() in taken else 'Username already used'
+
+# Project model field -> form field name
+PROJECT_FORM_FIELDS = [
+    ('title', 'title'),
+    ('description', 'description'),
+    ('status', 'status'),
+    ('difficulty', 'difficulty'),
+    ('priority', 'priority'),
+    ('github_url', 'github'),
+    ('deployment_url', 'deployment'),
+]
+
+def demo_session_key(request, create=False):
+    """
+    Session key that scopes an anonymous visitor's demo projects
+    (None for logged-in users, or when the visitor has no session yet)
+    """
+    if request.user.is_authenticated:
+        return None
+    if create and not request.session.session_key:
+        request.session.save()
+    return request.session.session_key
+
+def visitor_projects(request):
+    """
+    The projects the current visitor may see and edit
+    """
+    return Project.objects.visible_to(request.user, demo_session_key(request))
+
+# Aggregate that changes whenever anything in a vault does
+VAULT_VERSION = {'latest': Max('updated_at'), 'count': Count('id')}
+
+def vault_version(vault, owner, full_path):
+    """
+    (etag, last_modified) of a page from the VAULT_VERSION aggregate of its projects
+    """
+    latest = vault['latest']
+    version = f'{owner}:{vault["count"]}:{latest.timestamp() if latest else 0}:{full_path}'
+    return hashlib.md5(version.encode()).hexdigest(), latest
+
+def vault_freshness(request):
+    """
+    (etag, last_modified) of the visitor's vault for conditional GETs, from one
+    aggregate query over their projects. Any create, edit or tech-stack change
+    moves max(updated_at) and any delete changes the count.
+    """
+    if not hasattr(request, '_vault_freshness'):
+        request._vault_freshness = (None, None)
+        # Pending flash messages are part of the page, always render it then
+        if request.method in ('GET', 'HEAD') and not len(messages.get_messages(request)):
+            vault = visitor_projects(request).aggregate(**VAULT_VERSION)
+            owner = request.user.pk or demo_session_key(request)
+            request._vault_freshness = vault_version(vault, owner, request.get_full_path())
+    return request._vault_freshness
+
+def vault_etag(request, *args, **kwargs):
+    return vault_freshness(request)[0]
+
+def vault_last_modified(request, *args, **kwargs):
+    return vault_freshness(request)[1]
+
+# Repeat visits and polling tabs get a 304 without running the listing query
+# or the template; browsers must revalidate on every use
+vault_conditional = condition(etag_func=vault_etag, last_modified_func=vault_last_modified)
+vault_cache_control = cache_control(private=True, no_cache=True)
+
+def create_project(data, user, session_key=None):
+    """
+    Create a project and its tech stack from submitted form data in one transaction
+    """
+    with transaction.atomic():
+        project = Project.objects.create(
+            title=data.get('title'),
+            description=data.get('description'),
+            status=data.get('status', 'idea'),
+            difficulty=data.get('difficulty', 'medium'),
+            priority=data.get('priority', 'medium'),
+            github_url=data.get('github', ''),
+            deployment_url=data.get('deployment', ''),
+            user=user,
+            session_key=session_key,
+        )
+        added, _ = project.set_tech_stack(data.getlist('tech_stack'), is_new=True)
+    
+    changes = {
+        field: [None, getattr(project, field)] for field, _ in PROJECT_FORM_FIELDS if getattr(project, field)
+    }
+    if added:
+        changes['tech_stack'] = {'added': added, 'removed': []}
+    record_project(ProjectEvent.CREATED, project, changes)
+    return project
+
+@vault_cache_control
+@vault_conditional
+@ratelimit('create')
 def index(request):
     """
     Main page - handles both GET (show page) and POST (create project)
@@ -67,90 +195,258 @@ def index(request):
         # Handle form submission (create new project)
         if request.user.is_authenticated:
             # Logged-in users can create unlimited projects
-            title = request.POST.get('title')
-            description = request.POST.get('description')
-            status = request.POST.get('status', 'idea')
-            difficulty = request.POST.get('difficulty', 'medium')
-            priority = request.POST.get('priority', 'medium')
-            github_url = request.POST.get('github', '')
-            deployment_url = request.POST.get('deployment', '')
-            
-            # Create the project
-            project = Project.objects.create(
-                title=title,
-                description=description,
-                status=status,
-                difficulty=difficulty,
-                priority=priority,
-                github_url=github_url,
-                deployment_url=deployment_url,
-                user=request.user
-            )
-           
-            # Add tech stack items
-            tech_stack = request.POST.getlist('tech_stack')
-            for tech in tech_stack:
-                if tech.strip():  # Only add non-empty tech items
-                    TechStack.objects.create(project=project, name=tech.strip())
-            
+            create_project(request.POST, request.user)
             return redirect('index')
         else:
-            # Demo mode - check if user already has a project
-            existing_demo_projects = Project.objects.filter(user__isnull=True).count()
-            if existing_demo_projects >= 1:
+            # Demo mode - check if this visitor already has a project
+            if visitor_projects(request).exists():
                 # Don't show message here - let JavaScript handle it
                 return redirect('index')
             
-            title = request.POST.get('title')
-            description = request.POST.get('description')
-            status = request.POST.get('status', 'idea')
-            difficulty = request.POST.get('difficulty', 'medium')
-            priority = request.POST.get('priority', 'medium')
-            github_url = request.POST.get('github', '')
-            deployment_url = request.POST.get('deployment', '')
-            
-            # Create the project (demo mode - no user required)
-            project = Project.objects.create(
-                title=title,
-                description=description,
-                status=status,
-                difficulty=difficulty,
-                priority=priority,
-                github_url=github_url,
-                deployment_url=deployment_url,
-                user=None
-            )
-           
-            # Add tech stack items
-            tech_stack = request.POST.getlist('tech_stack')
-            for tech in tech_stack:
-                if tech.strip():  # Only add non-empty tech items
-                    TechStack.objects.create(project=project, name=tech.strip())
-            
+            # Create the project (demo mode - scoped to the visitor's session)
+            create_project(request.POST, None, demo_session_key(request, create=True))
             return redirect('index')
     
     # Handle GET request (show page)
-    if request.user.is_authenticated:
-        projects = Project.objects.filter(user=request.user).order_by('-created_at')
-    else:
-        # For demo mode, show projects created by anonymous users
-        # Clean up old demo projects (older than 1 hour)
-        from django.utils import timezone
-        from datetime import timedelta
-        cutoff_time = timezone.now() - timedelta(hours=1)
-        Project.objects.filter(user__isnull=True, created_at__lt=cutoff_time).delete()
-        
-        # Get projects created by anonymous users
-        projects = Project.objects.filter(user__isnull=True).order_by('-created_at')
+    # Only the first page is rendered, main.js loads the rest on scroll
+    session_key = demo_session_key(request)
+    projects, next_cursor = keyset_page(visitor_projects(request).with_tech())
     
+    return render(request, 'index.html', {
+        'projects': projects,
+        'next_cursor': next_cursor,
+        'stats': project_stats(request.user, session_key),
+        'technologies': tech_counts(request.user, session_key),
+    })
+
+@ratelimit('create')
+def add_project(request):
+    """
+    Create a project via AJAX, returning its rendered card and the new counters
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
     
+    session_key = None
+    if not request.user.is_authenticated and visitor_projects(request).exists():
+        # Demo visitors get one project, main.js asks them to sign up
+        return JsonResponse({
+            'success': False,
+            'auth_required': True,
+            'message': 'Sign up to create more projects',
+        }, status=403)
     
-    return render(request, 'index.html', {
-        'projects': projects
+    try:
+        if request.user.is_authenticated:
+            project = create_project(request.POST, request.user)
+        else:
+            session_key = demo_session_key(request, create=True)
+            project = create_project(request.POST, None, session_key)
+    except Exception as e:
+        return JsonResponse({'success': False, 'message': f'Error creating project: {str(e)}'})
+    
+    # One query for the card's tech badges
+    prefetch_related_objects([project], tech_prefetch())
+    stats = project_stats(request.user, session_key)
+    return JsonResponse({
+        'success': True,
+        'message': 'Project created successfully',
+        'html': render_to_string('project_card.html', {'project': project}, request=request),
+        'stats': {key: stats[key] for key in ('total', 'in_progress', 'completed', 'high_priority')},
+        'technologies': tech_counts(request.user, session_key),
     })
+
+def listing_filters(params):
+    """
+    Read the listing filters from a query dict ('all' means no filter)
+    """
+    filters = {}
+    for field in ('status', 'difficulty', 'priority', 'tech'):
+        value = params.get(field, '').strip()
+        if value and value != 'all':
+            filters[field] = value
+    filters['text'] = params.get('q', '').strip()
+    return filters
+
+def filtered_page(request):
+    """
+    One keyset page of the visitor's projects matching the request filters
+    """
+    return keyset_page(
+        visitor_projects(request).matching(**listing_filters(request.GET)).with_tech(),
+        cursor=request.GET.get('cursor'),
+        size=parse_page_size(request.GET.get('limit')),
+    )
+
+@vault_cache_control
+@vault_conditional
+def project_list(request):
+    """
+    Return a page of (optionally filtered) project cards as HTML for infinite scroll
+    """
+    try:
+        projects, next_cursor = filtered_page(request)
+    except InvalidCursor as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    html = render_to_string('project_cards.html', {'projects': projects}, request=request)
+    return JsonResponse({'success': True, 'html': html, 'next_cursor': next_cursor})
+
+@vault_cache_control
+@vault_conditional
+def search_projects(request):
+    """
+    Filter and full-text search the vault, returning projects as JSON
+    """
+    try:
+        projects, next_cursor = filtered_page(request)
+    except InvalidCursor as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    results = [{
+        'id': project.id,
+        'title': project.title,
+        'description': project.description,
+        'status': project.status,
+        'difficulty': project.difficulty,
+        'priority': project.priority,
+        'tech_stack': [tech.name for tech in project.tech_items.all()],
+        'github_url': project.github_url,
+        'deployment_url': project.deployment_url,
+        'created_at': project.created_at.isoformat(),
+    } for project in projects]
+    return JsonResponse({'success': True, 'results': results, 'next_cursor': next_cursor})
+
+def export_projects(request):
+    """
+    Stream the visitor's projects as NDJSON (default) or CSV
+    """
+    fmt = request.GET.get('format', 'ndjson')
+    if fmt not in transfer.FORMATS:
+        return JsonResponse({'success': False, 'message': 'Unsupported format'}, status=400)
+    
+    response = StreamingHttpResponse(
+        transfer.export_lines(visitor_projects(request), fmt),
+        content_type=transfer.CONTENT_TYPES[fmt],
+    )
+    response['Content-Disposition'] = f'attachment; filename="projects.{fmt}"'
+    return response
+
+def import_projects(request):
+    """
+    Import an uploaded NDJSON or CSV export into the logged-in user's vault
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    if not request.user.is_authenticated:
+        return JsonResponse({'success': False, 'message': 'Sign in to import projects'}, status=403)
+    
+    upload = request.FILES.get('file')
+    if upload is None:
+        return JsonResponse({'success': False, 'message': 'No file uploaded'}, status=400)
+    fmt = request.POST.get('format') or ('csv' if upload.name.endswith('.csv') else 'ndjson')
+    if fmt not in transfer.FORMATS:
+        return JsonResponse({'success': False, 'message': 'Unsupported format'}, status=400)
+    
+    # Read the upload line by line, large files stay on disk
+    lines = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+    result = transfer.import_projects(lines, fmt, request.user)
+    stopped = result['stopped']
+    if stopped:
+        # The batches before the error are committed
+        message = f"{stopped['message']}. Stopped after line {stopped['after_line']}, {result['created']} project(s) imported"
+        return JsonResponse({'success': False, 'message': message, **result}, status=400)
+    
+    return JsonResponse({'success': True, **result})
+
+# Bulk operation -> (project field, allowed values); None means delete
+BULK_OPERATIONS = {
+    'set_status': ('status', Project.STATUS_CHOICES),
+    'set_difficulty': ('difficulty', Project.DIFFICULTY_CHOICES),
+    'set_priority': ('priority', Project.PRIORITY_CHOICES),
+    'delete': None,
+}
+MAX_BULK_IDS = 1000
+
+@ratelimit('bulk')
+def bulk_projects(request):
+    """
+    Apply one operation to many projects via AJAX.
+    Body: {"ids": [...], "operation": "set_status", "value": "completed"}
+    """
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    try:
+        payload = json.loads(request.body)
+        ids, operation = payload['ids'], payload['operation']
+    except (ValueError, TypeError, KeyError):
+        ids = operation = None
+    # type() rather than isinstance(): JSON true and false load as bool, an int subclass
+    if not (isinstance(ids, list) and all(type(pk) is int for pk in ids) and isinstance(operation, str)):
+        return JsonResponse({'success': False, 'message': 'Expected a JSON body with a list of integer ids and an operation'}, status=400)
+    ids = list(dict.fromkeys(ids))
+    
+    if operation not in BULK_OPERATIONS:
+        return JsonResponse({'success': False, 'message': f'Unknown operation "{operation}"'}, status=400)
+    if len(ids) > MAX_BULK_IDS:
+        return JsonResponse({'success': False, 'message': f'At most {MAX_BULK_IDS} projects per request'}, status=400)
+    
+    changes = {}
+    if BULK_OPERATIONS[operation]:
+        field, choices = BULK_OPERATIONS[operation]
+        value = payload.get('value')
+        if not isinstance(value, str) or value not in dict(choices):
+            return JsonResponse({'success': False, 'message': f'Invalid {field} "{value}"'}, status=400)
+        # QuerySet.update() skips auto_now, set it explicitly
+        changes = {field: value, 'updated_at': timezone.now()}
+    
+    with write_atomic():
+        # One ownership check for every id, reading what the history needs
+        owned = dict(visitor_projects(request).filter(id__in=ids).values_list('id', field if changes else 'title'))
+        projects = Project.objects.filter(id__in=owned)
+        if changes:
+            projects.update(**changes)
+            # update() sends no signals
+            invalidate_owner(request.user.pk, demo_session_key(request))
+        elif owned:
+            projects.delete()
+    
+    user_id, session_key = request.user.pk, demo_session_key(request)
+    for pk, current in owned.items():
+        if not changes:
+            record(ProjectEvent.DELETED, pk, user_id, session_key, {'title': current})
+        elif current != value:
+            record(ProjectEvent.UPDATED, pk, user_id, session_key, {field: [current, value]})
+    
+    results = [
+        {'id': pk, 'success': True} if pk in owned else {'id': pk, 'success': False, 'message': 'Project not found'}
+        for pk in ids
+    ]
+    return JsonResponse({'success': True, 'updated': len(owned), 'results': results})
+
+@staff_member_required
+def perf_report_view(request):
+    """
+    Rolling per-view latency and query percentiles (staff only)
+    """
+    return JsonResponse({'enabled': settings.PERF_INSTRUMENTATION, 'views': perf_report()})
+
+def hashing_busy(request, template):
+    """
+    429 for a login or registration while the password hashing pool is full
+    """
+    messages.error(request, 'The server is busy right now, please try again in a moment.')
+    response = render(request, template, status=429)
+    response['Retry-After'] = '1'
+    return response
+
+@ratelimit('register', template='register.html')
 def register(request):
     if request.method=='POST':
-       username=request.POST['username']
+       # NFKC, as create_user and the admin do, so look-alike spellings of a
+       # name are checked and stored as the same username
+       username=User.normalize_username(request.POST['username'])
        email=request.POST['email']
        password=request.POST['password']
        password2=request.POST['password2']
@@ -167,21 +463,30 @@ def register(request):
            messages.error(request, strength_message)
            return redirect('register')
        
-       if password==password2:
-          if User.objects.filter(email=email).exists():
-             messages.info(request,'Email already used')
-             return redirect('register')
-          elif User.objects.filter(username=username).exists():
-                messages.info(request,'Username already used')
-                return redirect('register')
-          else:
-             user=User.objects.create_user(username=username,password=password,email=email)
-             user.save()
-             messages.success(request, 'Account created successfully! Please log in.')
-             return redirect('login')
-       else:
+       if password!=password2:
           messages.info(request,'Password not matching')
           return redirect('register')
+       
+       # Checked before hashing so taken names cost no hashing time
+       conflict=registration_conflict(username,email)
+       if conflict:
+          messages.info(request,conflict)
+          return redirect('register')
+       
+       try:
+          hashed=hash_password(password)
+       except HashingBusy:
+          return hashing_busy(request,'register.html')
+       
+       # The unique constraints decide if another registration won the race
+       try:
+          with transaction.atomic():
+             User.objects.create(username=username,email=User.objects.normalize_email(email),password=hashed)
+       except IntegrityError:
+          messages.info(request,registration_conflict(username,email) or 'Username already used')
+          return redirect('register')
+       messages.success(request, 'Account created successfully! Please log in.')
+       return redirect('login')
             
     else:
      return render(request,'register.html')
@@ -191,11 +496,15 @@ def register(request):
  # name='john'  return render(request,'index.html', 'name': name) name is key and name is variable 
 
 
+@ratelimit('login', template='login.html')
 def login(request):
    if request.method=='POST':
       username=request.POST['username']
       password=request.POST['password']
-      user=auth.authenticate(username=username,password=password)
+      try:
+         user=auth.authenticate(request,username=username,password=password)
+      except HashingBusy:
+         return hashing_busy(request,'login.html')
       if user is not None :
          auth.login(request,user)
          return redirect('index')
@@ -210,7 +519,36 @@ def logout(request):
 def post(request,pk):
    return render(request,'post.html',{'pk':pk})
 
+def apply_project_update(projects, project_id, data):
+    """
+    Save the submitted changes to project ``project_id`` of ``projects`` in one
+    transaction, writing only the fields and tech items that actually changed.
+    Returns the project and the changes in ProjectEvent.changes form.
+    """
+    with write_atomic():
+        # Read in the transaction that writes it, so the diff cannot be lost
+        # to a concurrent update (SQLite's BEGIN IMMEDIATE already locks)
+        project = get_object_or_404(projects.select_for_update(), id=project_id)
+        changes = {}
+        for field, param in PROJECT_FORM_FIELDS:
+            current = getattr(project, field)
+            value = data.get(param, current)
+            if value != current and (value or current):  # None and '' are both "empty"
+                setattr(project, field, value)
+                changes[field] = [current, value]
+        
+        # Update tech stack
+        added, removed = project.set_tech_stack(data.getlist('tech_stack'))
+        
+        if changes or added or removed:
+            project.save(update_fields=list(changes) + ['updated_at'])
+    
+    if added or removed:
+        changes['tech_stack'] = {'added': added, 'removed': removed}
+    return project, changes
+
 @csrf_exempt
+@ratelimit('update')
 def update_project(request, project_id):
     """
     Update an existing project via AJAX
@@ -219,28 +557,14 @@ def update_project(request, project_id):
         try:
             if request.user.is_authenticated:
                 # Logged-in user can only update their own projects
-                project = get_object_or_404(Project, id=project_id, user=request.user)
+                projects = Project.objects.filter(user=request.user)
             else:
-                # Demo mode - can update the single demo project
-                project = get_object_or_404(Project, id=project_id, user__isnull=True)
-            
-            # Update project fields
-            project.title = request.POST.get('title', project.title)
-            project.description = request.POST.get('description', project.description)
-            project.status = request.POST.get('status', project.status)
-            project.difficulty = request.POST.get('difficulty', project.difficulty)
-            project.priority = request.POST.get('priority', project.priority)
-            project.github_url = request.POST.get('github', project.github_url)
-            project.deployment_url = request.POST.get('deployment', project.deployment_url)
-            project.save()
-            
-            # Update tech stack
-            TechStack.objects.filter(project=project).delete()  # Remove existing tech stack
-            tech_stack = request.POST.getlist('tech_stack')
-            for tech in tech_stack:
-                if tech.strip():
-                    TechStack.objects.create(project=project, name=tech.strip())
+                # Demo mode - can only update the visitor's own demo project
+                projects = visitor_projects(request)
             
+            project, changes = apply_project_update(projects, project_id, request.POST)
+            if changes:
+                record_project(ProjectEvent.UPDATED, project, changes)
             return JsonResponse({'success': True, 'message': 'Project updated successfully'})
             
         except Exception as e:
@@ -249,6 +573,7 @@ def update_project(request, project_id):
     return JsonResponse({'success': False, 'message': 'Invalid request method'})
 
 @csrf_exempt
+@ratelimit('delete')
 def delete_project(request, project_id):
     """
     Delete a project via AJAX
@@ -259,10 +584,12 @@ def delete_project(request, project_id):
                 # Logged-in user can only delete their own projects
                 project = get_object_or_404(Project, id=project_id, user=request.user)
             else:
-                # Demo mode - can delete the single demo project
-                project = get_object_or_404(Project, id=project_id, user__isnull=True)
+                # Demo mode - can only delete the visitor's own demo project
+                project = get_object_or_404(visitor_projects(request), id=project_id)
             
+            project_pk = project.pk  # delete() clears it
             project.delete()
+            record(ProjectEvent.DELETED, project_pk, project.user_id, project.session_key, {'title': project.title})
             return JsonResponse({'success': True, 'message': 'Project deleted successfully'})
             
         except Exception as e:
@@ -0,0 +1,177 @@
+"""
+Pay the first-request costs of a process before it accepts traffic.
+
+A fresh process builds the URL resolver, compiles each template, opens its
+database connection and imports the modules that middleware and views load
+lazily on the first request that needs them. warm_up() does all of that
+ahead of time, the last part by sending settings.WARMUP_URLS through the
+WSGI or ASGI application; gunicorn.conf.py calls it in every worker (and,
+with preloading, once in the master so the forks inherit the work).
+"""
+import asyncio
+import logging
+import time
+from pathlib import Path
+from wsgiref.util import setup_testing_defaults
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.db import connections
+from django.template import engines
+from django.urls import NoReverseMatch, get_resolver, resolve, reverse
+
+logger = logging.getLogger(__name__)
+
+
+def warmup_templates():
+    """
+    Names of the project templates, relative to the template directories
+    """
+    names = set()
+    for engine in settings.TEMPLATES:
+        for directory in map(Path, engine.get('DIRS', [])):
+            names.update(str(path.relative_to(directory)) for path in directory.glob('**/*.html'))
+    return sorted(names)
+
+
+def compile_templates(names):
+    """
+    Load ``names`` through every engine; the cached loader keeps them compiled
+    """
+    for engine in engines.all():
+        for name in names:
+            engine.get_template(name)
+    return len(names)
+
+
+def resolve_routes():
+    """
+    Populate the URL resolver and resolve every route without arguments
+    """
+    resolver = get_resolver()
+    resolver.reverse_dict  # Builds the reverse lookup tables
+    resolved = 0
+    for name in list(resolver.reverse_dict):
+        if not isinstance(name, str):
+            continue  # Views registered by callable
+        try:
+            resolve(reverse(name))
+        except NoReverseMatch:
+            continue  # Needs arguments
+        resolved += 1
+    return resolved
+
+
+def connect_databases():
+    for connection in connections.all():
+        connection.ensure_connection()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    return len(connections.all())
+
+
+def warmup_host():
+    """
+    A Host header that passes ALLOWED_HOSTS
+    """
+    for host in settings.ALLOWED_HOSTS:
+        if host and not host.startswith('.') and '*' not in host:
+            return host
+    return 'localhost'
+
+
+def wsgi_get(application, path, host=None):
+    """
+    GET ``path`` from a WSGI application in-process, returns the status code
+    """
+    environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'HTTP_HOST': host or warmup_host()}
+    setup_testing_defaults(environ)
+    status = []
+    response = application(environ, lambda code, headers, exc_info=None: status.append(code))
+    try:
+        b''.join(response)
+    finally:
+        if hasattr(response, 'close'):
+            response.close()  # Sends request_finished
+    return int(status[0].split()[0])
+
+
+def is_asgi(application):
+    return isinstance(application, ASGIHandler) or iscoroutinefunction(application) or (
+        iscoroutinefunction(getattr(application, '__call__', None))
+    )
+
+
+async def asgi_get(application, path, host=None):
+    """
+    GET ``path`` from an ASGI application in-process, returns the status code
+    """
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', (host or warmup_host()).encode())],
+        'client': ('127.0.0.1', 0),
+        'server': ('localhost', 80),
+    }
+    status = []
+    finished = asyncio.Event()
+    messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        # The client stays connected until the response is complete
+        await finished.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            status.append(message['status'])
+        elif message['type'] == 'http.response.body' and not message.get('more_body'):
+            finished.set()
+
+    await application(scope, receive, send)
+    finished.set()
+    return status[0]
+
+
+def request_pages(application, paths):
+    get = async_to_sync(asgi_get) if is_asgi(application) else wsgi_get
+    for path in paths:
+        status = get(application, path)
+        if status >= 500:
+            logger.warning('Warm-up request for %s returned %s', path, status)
+    return len(paths)
+
+
+def warm_up(application=None, database=True):
+    """
+    Compile the templates, build the URL resolver, GET settings.WARMUP_URLS
+    from ``application`` (WSGI or ASGI) when given and, unless ``database`` is off, open
+    the database connections of this process. Returns the number of items
+    warmed and the time spent on each step, in ms.
+    """
+    steps = [
+        ('templates', lambda: compile_templates(settings.WARMUP_TEMPLATES or warmup_templates())),
+        ('urls', resolve_routes),
+    ]
+    if database:
+        steps.append(('database', connect_databases))
+    if application is not None:
+        steps.append(('requests', lambda: request_pages(application, settings.WARMUP_URLS)))
+
+    report = {}
+    for name, step in steps:
+        start = time.perf_counter()
+        count = step()
+        report[name] = {'count': count, 'ms': round((time.perf_counter() - start) * 1000, 2)}
+    logger.info('Warmed up %s', ', '.join(f"{name} ({step['count']}, {step['ms']} ms)" for name, step in report.items()))
+    return report
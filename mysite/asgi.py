@@ -13,4 +13,10 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Static files are answered before Django, WhiteNoiseMiddleware would move
+# every request to a thread (see myapp/static.py)
+from myapp.static import StaticFilesASGI  # noqa: E402
+
+application = StaticFilesASGI(django_application)
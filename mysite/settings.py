@@ -11,7 +11,14 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import hashlib
+import importlib.util
 import os
+import tempfile
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .database import database_config, sqlite_pragmas
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -24,7 +31,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'django-insecure-+92f!(mte$i(r#+z4xbdp47pn_jk!xng-qhybyph88a&@dr6@_'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.environ.get('DEBUG', 'True') in ('1', 'true', 'True')
 
 ALLOWED_HOSTS = ['*']
 
@@ -42,7 +49,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Does nothing unless PERF_INSTRUMENTATION is on
+    'myapp.middleware.PerformanceMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # Serves collected static files, before anything touches the session
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -63,23 +74,196 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'myapp.context_processors.card_template_version',
             ],
         },
     },
 ]
 
+# The cached loader compiles each template once per process. Django enables
+# it by default; production spells it out so the warm-up in myapp/warmup.py
+# (run from gunicorn.conf.py) can rely on it.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
+# Templates compiled by myapp.warmup before a worker takes requests,
+# empty for every template under TEMPLATES DIRS
+WARMUP_TEMPLATES = []
+# Pages requested in-process by the warm-up, GETs without side effects only
+WARMUP_URLS = ['/login', '/register']
+
 WSGI_APPLICATION = 'mysite.wsgi.application'
 
+# Serve the listing, update and delete endpoints from myapp/async_views.py.
+# Turn on when running under ASGI (uvicorn), under WSGI it only adds overhead.
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', '') in ('1', 'true', 'True')
+# WhiteNoiseMiddleware is sync only, under ASGI it would put every request
+# and the async views in a thread. mysite/asgi.py serves the static files
+# in its place (myapp/static.py).
+if ASYNC_VIEWS:
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# DATABASE_URL, DB_CONN_MAX_AGE, DB_CONN_HEALTH_CHECKS and the SQLITE_* pragma
+# variables are described in mysite/database.py
 
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+    'default': database_config(os.environ.get('DATABASE_URL', f"sqlite:///{BASE_DIR / 'db.sqlite3'}")),
+}
+
+# Switching to WAL rewrites the database header, and db.sqlite3 is checked
+# in: it keeps its rollback journal unless SQLITE_JOURNAL_MODE says
+# otherwise, so manage.py commands leave the tracked file alone. Any other
+# SQLite database defaults to WAL.
+DEV_DATABASE = os.path.abspath(DATABASES['default']['NAME']) == str(BASE_DIR / 'db.sqlite3')
+SQLITE_PRAGMAS = sqlite_pragmas(journal_mode=None if DEV_DATABASE else 'WAL')
+
+
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# CACHE_BACKEND / FRAGMENT_CACHE_BACKEND pick locmem (default), file or redis,
+# *_LOCATION is the cache name, directory or redis:// URL. locmem is private to
+# each process, so run production with a file or redis 'default' cache to share
+# the cached stats and their invalidations between gunicorn workers.
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+
+def cache_config(prefix, default_location):
+    return {
+        'BACKEND': CACHE_BACKENDS[os.environ.get(f'{prefix}_BACKEND', 'locmem')],
+        'LOCATION': os.environ.get(f'{prefix}_LOCATION', default_location),
     }
+
+CACHES = {
+    'default': cache_config('CACHE', 'default'),
+    # Rendered project cards, keyed by project id and updated_at
+    'fragments': cache_config('FRAGMENT_CACHE', 'fragments'),
 }
+# Also part of the card keys: a deploy that changes the card template must
+# not serve cards the old one rendered from a shared or file fragment cache
+CARD_TEMPLATE_VERSION = hashlib.md5((BASE_DIR / 'templates' / 'project_card.html').read_bytes(), usedforsecurity=False).hexdigest()[:12]
+# Whether every worker sees the same 'default' cache (file caches are shared
+# by the workers of one host)
+SHARED_CACHE = CACHES['default']['BACKEND'] != CACHE_BACKENDS['locmem']
+
+
+# Sessions
+# SESSION_BACKEND=cached_db reads sessions from the default cache and writes
+# them through to the database, so a session read costs no query once
+# cached. 'cache' skips the database (sessions are lost with the cache, use
+# redis), 'db' is Django's default. Both cached engines need a SHARED_CACHE:
+# a logout only clears the session from its own worker's locmem, the other
+# workers would keep accepting the cookie. The default is cached_db with a
+# shared cache and db otherwise. Signed-cookie sessions are not offered: demo
+# projects are owned by a stable session key.
+
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+}
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'cached_db' if SHARED_CACHE else 'db')
+if SESSION_BACKEND != 'db' and not SHARED_CACHE and not DEBUG:
+    raise ImproperlyConfigured(f'SESSION_BACKEND={SESSION_BACKEND} needs CACHE_BACKEND=file or redis')
+SESSION_ENGINE = SESSION_ENGINES[SESSION_BACKEND]
+SESSION_CACHE_ALIAS = 'default'
+
+
+# Rate limits (myapp/ratelimit.py)
+# Allowed requests per scope, counted per client IP, session cookie and
+# submitted username in the RATELIMIT_CACHE_ALIAS cache. Behind a proxy set
+# RATELIMIT_IP_META to the header carrying the client address
+# (e.g. HTTP_X_REAL_IP); REMOTE_ADDR would be the proxy for every request.
+RATELIMIT_ENABLED = os.environ.get('RATELIMIT_ENABLED', '1') in ('1', 'true', 'True')
+RATELIMIT_CACHE_ALIAS = 'default'
+RATELIMIT_IP_META = os.environ.get('RATELIMIT_IP_META', 'REMOTE_ADDR')
+RATELIMITS = {
+    'login': {'ip': '30/m', 'username': '10/m'},
+    'register': {'ip': '10/m'},
+    # Project writes from the index form and the AJAX endpoints
+    'create': {'ip': '60/m', 'session': '20/m'},
+    'update': {'ip': '120/m', 'session': '60/m'},
+    'delete': {'ip': '120/m', 'session': '60/m'},
+    # One request can change up to MAX_BULK_IDS projects
+    'bulk': {'ip': '30/m', 'session': '10/m'},
+}
+
+
+# Authentication and password hashing
+# Passwords are hashed on a per-process pool (myapp/auth_pool.py) sized
+# from the server layout below: about one hashing thread per CPU on the
+# host, and at most half of a process's request threads hashing or waiting.
+# When it is full, login and register answer 429. AUTH_HASH_WORKERS and
+# AUTH_HASH_QUEUE override the sizes. PASSWORD_HASHER picks the hasher for new passwords
+# (pbkdf2, scrypt or argon2, which needs argon2-cffi). Older hashes keep
+# working and are rehashed on the next login.
+
+# With AUTH_USER_CACHE on (the default with a SHARED_CACHE), CachedModelBackend
+# also caches the user loaded on every request for AUTH_USER_CACHE_TIMEOUT
+# seconds. Saving the user drops the entry, which on locmem would only reach
+# the worker that saved it: a deactivated user or changed password would
+# keep old sessions working elsewhere.
+AUTH_USER_CACHE = os.environ.get('AUTH_USER_CACHE', '1' if SHARED_CACHE else '0') in ('1', 'true', 'True')
+if AUTH_USER_CACHE and not SHARED_CACHE and not DEBUG:
+    raise ImproperlyConfigured('AUTH_USER_CACHE needs CACHE_BACKEND=file or redis')
+AUTHENTICATION_BACKENDS = [
+    'myapp.backends.CachedModelBackend' if AUTH_USER_CACHE else 'myapp.backends.PooledModelBackend',
+]
+AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', 15 * 60))
+
+AUTH_HASH_WORKERS = int(os.environ['AUTH_HASH_WORKERS']) if 'AUTH_HASH_WORKERS' in os.environ else None
+AUTH_HASH_QUEUE = int(os.environ['AUTH_HASH_QUEUE']) if 'AUTH_HASH_QUEUE' in os.environ else None
+
+# Server processes per host and request threads per process, with the
+# defaults of gunicorn.conf.py; its workers pass the values they actually
+# run with to the hashing pool
+SERVER_PROCESSES = int(os.environ.get('GUNICORN_WORKERS', os.cpu_count() or 1))
+SERVER_THREADS = int(os.environ.get('GUNICORN_THREADS', 4))
+
+PREFERRED_PASSWORD_HASHERS = {
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'scrypt': 'myapp.hashers.ScryptPasswordHasher',
+    'argon2': 'myapp.hashers.Argon2PasswordHasher',
+}
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'pbkdf2')
+if PASSWORD_HASHER not in PREFERRED_PASSWORD_HASHERS:
+    raise ImproperlyConfigured(f'PASSWORD_HASHER must be one of {", ".join(PREFERRED_PASSWORD_HASHERS)}')
+if PASSWORD_HASHER == 'argon2' and importlib.util.find_spec('argon2') is None:
+    raise ImproperlyConfigured('PASSWORD_HASHER=argon2 needs argon2-cffi (pip install argon2-cffi)')
+
+# Still verify passwords hashed by any of Django's default hashers. One
+# hasher per algorithm: Django verifies with the last one listed for it, so
+# scrypt and argon2 hashes must only reach the tuned hashers.
+PASSWORD_HASHERS = [PREFERRED_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for hasher in [
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+        PREFERRED_PASSWORD_HASHERS['argon2'],
+        'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+        PREFERRED_PASSWORD_HASHERS['scrypt'],
+    ] if hasher != PREFERRED_PASSWORD_HASHERS[PASSWORD_HASHER]
+]
+
+# Costs of the tuned hashers; raising them upgrades hashes on the next login
+SCRYPT_WORK_FACTOR = int(os.environ.get('SCRYPT_WORK_FACTOR', 2 ** 14))
+SCRYPT_BLOCK_SIZE = int(os.environ.get('SCRYPT_BLOCK_SIZE', 8))
+SCRYPT_PARALLELISM = int(os.environ.get('SCRYPT_PARALLELISM', 1))
+ARGON2_TIME_COST = int(os.environ.get('ARGON2_TIME_COST', 2))
+ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', 19456))  # KiB
+# One lane per hash: the pool already runs one hash per core
+ARGON2_PARALLELISM = int(os.environ.get('ARGON2_PARALLELISM', 1))
 
 
 # Password validation
@@ -119,7 +303,62 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+
+# With DEBUG off, collectstatic writes minified, content-hashed and
+# pre-compressed files (myapp/storage.py) that WhiteNoise serves with
+# immutable far-future caching. Run collectstatic on every deploy.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'myapp.storage.MinifiedManifestStaticFilesStorage'
+        ),
+    },
+}
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Demo mode
+# Demo projects older than DEMO_PROJECT_TTL seconds are hidden right away and
+# deleted by `manage.py purge_demo_projects` (cron) or, when
+# DEMO_PURGE_INTERVAL is set, by a background thread in each web process.
+
+DEMO_PROJECT_TTL = int(os.environ.get('DEMO_PROJECT_TTL', 60 * 60))
+DEMO_PURGE_BATCH_SIZE = int(os.environ.get('DEMO_PURGE_BATCH_SIZE', 500))
+DEMO_PURGE_INTERVAL = int(os.environ.get('DEMO_PURGE_INTERVAL', 0))
+DEMO_PURGE_LOCK_FILE = os.environ.get(
+    'DEMO_PURGE_LOCK_FILE', os.path.join(tempfile.gettempdir(), 'projectvault-demo-purge.lock')
+)
+
+
+# Project history (myapp/history.py)
+# Views queue a ProjectEvent per create, edit and delete; a background thread
+# in each process writes them with bulk_create, HISTORY_BATCH_SIZE at a time,
+# waiting at most HISTORY_FLUSH_INTERVAL seconds for a batch to fill (0
+# disables the thread, events then wait for history.flush()). Past
+# HISTORY_QUEUE_SIZE queued events new ones are dropped instead of slowing
+# requests down.
+
+HISTORY_ENABLED = os.environ.get('HISTORY_ENABLED', '1') in ('1', 'true', 'True')
+HISTORY_QUEUE_SIZE = int(os.environ.get('HISTORY_QUEUE_SIZE', 10000))
+HISTORY_BATCH_SIZE = int(os.environ.get('HISTORY_BATCH_SIZE', 500))
+HISTORY_FLUSH_INTERVAL = float(os.environ.get('HISTORY_FLUSH_INTERVAL', 1))
+
+
+# Request instrumentation
+# PERF_INSTRUMENTATION=1 adds Server-Timing headers, flags repeated queries and
+# keeps the last PERF_WINDOW samples per view (see `manage.py perf_report` and
+# /_perf/). Use a shared cache so the report covers every worker.
+
+PERF_INSTRUMENTATION = os.environ.get('PERF_INSTRUMENTATION', '') in ('1', 'true', 'True')
+PERF_WINDOW = int(os.environ.get('PERF_WINDOW', 500))
+PERF_DUPLICATE_THRESHOLD = int(os.environ.get('PERF_DUPLICATE_THRESHOLD', 3))
+PERF_CACHE_ALIAS = 'default'
@@ -0,0 +1,20 @@
+"""
+SQLite backend that can start a transaction with BEGIN IMMEDIATE.
+
+In WAL mode a transaction that has read and then tries to write fails at
+once with "database is locked" if another connection committed since its
+read, busy_timeout does not apply. myapp.models.write_atomic() sets
+begin_immediate for the BEGIN of the blocks that read before they write,
+so they take the write lock up front and wait for each other instead.
+Every other transaction, including the admin's and other read-only
+atomic blocks, begins deferred as usual. (Django 5.1 offers a
+connection-wide OPTIONS["transaction_mode"].)
+"""
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    begin_immediate = False
+
+    def _start_transaction_under_autocommit(self):
+        self.cursor().execute('BEGIN IMMEDIATE' if self.begin_immediate else 'BEGIN')
@@ -17,6 +17,14 @@ const searchInput = document.getElementById('search');
 const deleteModal = document.getElementById('delete-modal');
 const deleteForm = document.getElementById('delete-form');
 const cancelDeleteBtn = document.getElementById('cancel-delete');
+const projectsSentinel = document.getElementById('projects-sentinel');
+const bulkBar = document.getElementById('bulk-bar');
+const bulkCount = document.getElementById('bulk-count');
+
+// Pagination state
+let loadingMore = false;
+let filterTimer = null;
+let filterRequestId = 0;
 
 // Stats elements
 const totalProjectsEl = document.getElementById('total-projects');
@@ -55,8 +63,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
 function initializeApp() {
   setupEventListeners();
-  updateTechFilter();
-  updateStats();
+  setupInfiniteScroll();
 }
 
 function setupEventListeners() {
@@ -143,7 +150,11 @@ function setupEventListeners() {
   if (statusFilter) statusFilter.addEventListener('change', applyFilters);
   if (difficultyFilter) difficultyFilter.addEventListener('change', applyFilters);
   if (techFilter) techFilter.addEventListener('change', applyFilters);
-  if (searchInput) searchInput.addEventListener('input', applyFilters);
+  if (searchInput) searchInput.addEventListener('input', () => {
+    // Debounce typing so we query the server once the user pauses
+    clearTimeout(filterTimer);
+    filterTimer = setTimeout(applyFilters, 250);
+  });
 
   // Close modal on overlay click
   if (formModal) {
@@ -182,6 +193,29 @@ function setupEventListeners() {
     cancelDeleteBtn.addEventListener('click', hideDeleteModal);
   }
 
+  // Bulk actions on the selected cards
+  if (bulkBar) {
+    projectsGrid.addEventListener('change', (e) => {
+      if (e.target.classList.contains('project-select')) updateBulkBar();
+    });
+    document.getElementById('bulk-status').addEventListener('change', (e) => {
+      if (e.target.value) bulkProjects(selectedProjectIds(), 'set_status', e.target.value);
+    });
+    document.getElementById('bulk-priority').addEventListener('change', (e) => {
+      if (e.target.value) bulkProjects(selectedProjectIds(), 'set_priority', e.target.value);
+    });
+    document.getElementById('bulk-delete').addEventListener('click', () => {
+      const ids = selectedProjectIds();
+      if (confirm(`Delete ${ids.length} selected project(s)? This cannot be undone.`)) {
+        bulkProjects(ids, 'delete').then(updateBulkBar);
+      }
+    });
+    document.getElementById('bulk-clear').addEventListener('click', () => {
+      projectsGrid.querySelectorAll('.project-select:checked').forEach(box => { box.checked = false; });
+      updateBulkBar();
+    });
+  }
+
   // Close dropdowns when clicking outside
   document.addEventListener('click', (e) => {
     if (!e.target.closest('.dropdown')) {
@@ -236,8 +270,8 @@ function handleFormSubmit(e) {
     // Update existing project via AJAX
     updateProject(currentProjectId);
   } else {
-    // Create new project - submit form normally
-    projectForm.submit();
+    // Create new project via AJAX
+    createProject();
   }
 }
 
@@ -311,92 +345,159 @@ function toggleDropdown(projectId) {
   dropdown.classList.toggle('hidden');
 }
 
+// Current filter values as query parameters for the listing endpoint
+function filterParams() {
+  const params = new URLSearchParams();
+  if (statusFilter && statusFilter.value !== 'all') params.set('status', statusFilter.value);
+  if (difficultyFilter && difficultyFilter.value !== 'all') params.set('difficulty', difficultyFilter.value);
+  if (techFilter && techFilter.value !== 'all') params.set('tech', techFilter.value);
+  if (searchInput && searchInput.value.trim()) params.set('q', searchInput.value.trim());
+  return params;
+}
+
+// Filtering and search run on the server against indexed columns, the grid
+// is replaced with the first page of matching cards
 function applyFilters() {
-  const statusValue = statusFilter ? statusFilter.value : 'all';
-  const difficultyValue = difficultyFilter ? difficultyFilter.value : 'all';
-  const techValue = techFilter ? techFilter.value : 'all';
-  const searchValue = searchInput ? searchInput.value.toLowerCase() : '';
-
-  // Get all project cards
-  const projectCards = document.querySelectorAll('.project-card');
-  let visibleCount = 0;
-
-  projectCards.forEach(card => {
-    const cardStatus = card.dataset.status;
-    const cardDifficulty = card.dataset.difficulty;
-    const cardTechs = card.dataset.tech ? card.dataset.tech.split(',') : [];
-    const cardTitle = card.dataset.title || '';
-    const cardDescription = card.dataset.description || '';
-
-    const matchesStatus = statusValue === 'all' || cardStatus === statusValue;
-    const matchesDifficulty = difficultyValue === 'all' || cardDifficulty === difficultyValue;
-    const matchesTech = techValue === 'all' || cardTechs.includes(techValue);
-    const matchesSearch = searchValue === '' || 
-      cardTitle.includes(searchValue) ||
-      cardDescription.includes(searchValue);
-
-    if (matchesStatus && matchesDifficulty && matchesTech && matchesSearch) {
-      card.style.display = 'block';
-      visibleCount++;
-    } else {
-      card.style.display = 'none';
-    }
+  const requestId = ++filterRequestId;
+
+  fetch(`/projects/?${filterParams()}`, {
+    headers: { 'X-Requested-With': 'XMLHttpRequest' }
+  })
+  .then(response => response.json())
+  .then(data => {
+    // Ignore responses to filters the user has already changed
+    if (requestId !== filterRequestId) return;
+    if (!data.success) throw new Error(data.message);
+
+    projectsGrid.innerHTML = data.html.trim() ||
+      '<div class="col-span-full text-center py-12"><p class="text-muted-foreground text-lg">No projects found</p></div>';
+    projectsGrid.dataset.nextCursor = data.next_cursor || '';
+    if (projectsSentinel) projectsSentinel.classList.toggle('hidden', !data.next_cursor);
+    // The selected cards were replaced
+    if (bulkBar) updateBulkBar();
+  })
+  .catch(error => {
+    console.error('Error filtering projects:', error);
   });
+}
+
+// Stats are rendered by the server for the whole vault (not just the loaded
+// page), so client-side changes only adjust them by the affected card
+function adjustStats(card, delta) {
+  if (!totalProjectsEl || !card) return;
+
+  const bump = (el, by) => {
+    if (el) el.textContent = Math.max(0, (parseInt(el.textContent, 10) || 0) + by);
+  };
 
-  // Show/hide empty state
-  const emptyState = projectsGrid.querySelector('.col-span-full');
-  if (emptyState) {
-    emptyState.style.display = visibleCount === 0 ? 'block' : 'none';
+  bump(totalProjectsEl, delta);
+  if (card.dataset.status === 'in-progress') bump(inProgressCountEl, delta);
+  if (card.dataset.status === 'completed') bump(completedCountEl, delta);
+  if (card.dataset.priority === 'high') bump(highPriorityCountEl, delta);
+}
+
+// Infinite scroll: fetch the next page of cards when the sentinel is visible
+function setupInfiniteScroll() {
+  if (!projectsSentinel || !projectsGrid) return;
+
+  if ('IntersectionObserver' in window) {
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some(entry => entry.isIntersecting)) {
+        loadMoreProjects();
+      }
+    }, { rootMargin: '400px' });
+    observer.observe(projectsSentinel);
+  } else {
+    projectsSentinel.addEventListener('click', loadMoreProjects);
   }
 }
 
-function updateTechFilter() {
-  if (!techFilter) return;
-  
-  // Get all unique technologies from project cards
-  const projectCards = document.querySelectorAll('.project-card');
-  const allTechs = new Set();
-  
-  projectCards.forEach(card => {
-    const techs = card.dataset.tech ? card.dataset.tech.split(',') : [];
-    techs.forEach(tech => {
-      if (tech.trim()) allTechs.add(tech.trim());
-    });
+function loadMoreProjects() {
+  const cursor = projectsGrid.dataset.nextCursor;
+  if (!cursor || loadingMore) return;
+  loadingMore = true;
+
+  const params = filterParams();
+  params.set('cursor', cursor);
+  const requestId = filterRequestId;
+
+  fetch(`/projects/?${params}`, {
+    headers: { 'X-Requested-With': 'XMLHttpRequest' }
+  })
+  .then(response => response.json())
+  .then(data => {
+    // The filters changed while this page was loading
+    if (requestId !== filterRequestId) return;
+    if (!data.success) throw new Error(data.message);
+
+    projectsGrid.insertAdjacentHTML('beforeend', data.html);
+    projectsGrid.dataset.nextCursor = data.next_cursor || '';
+    if (!data.next_cursor) projectsSentinel.classList.add('hidden');
+  })
+  .catch(error => {
+    console.error('Error loading projects:', error);
+  })
+  .finally(() => {
+    loadingMore = false;
   });
-  
-  // Populate tech filter
-  techFilter.innerHTML = '<option value="all">All Technologies</option>';
-  [...allTechs].sort().forEach(tech => {
+}
+
+// Replace the counters with the values computed by the server
+function setStats(stats) {
+  if (totalProjectsEl) totalProjectsEl.textContent = stats.total;
+  if (inProgressCountEl) inProgressCountEl.textContent = stats.in_progress;
+  if (completedCountEl) completedCountEl.textContent = stats.completed;
+  if (highPriorityCountEl) highPriorityCountEl.textContent = stats.high_priority;
+}
+
+// Rebuild the technology filter options, keeping the current selection
+function setTechOptions(technologies) {
+  if (!techFilter) return;
+  const selected = techFilter.value;
+  techFilter.querySelectorAll('option:not([value="all"])').forEach(option => option.remove());
+  technologies.forEach(tech => {
     const option = document.createElement('option');
-    option.value = tech;
-    option.textContent = tech;
+    option.value = tech.name;
+    option.textContent = `${tech.name} (${tech.count})`;
     techFilter.appendChild(option);
   });
+  techFilter.value = selected;
+  if (techFilter.value !== selected) techFilter.value = 'all';
 }
 
-function updateStats() {
-  if (!totalProjectsEl) return;
-  
-  const projectCards = document.querySelectorAll('.project-card');
-  const total = projectCards.length;
-  
-  let inProgress = 0;
-  let completed = 0;
-  let highPriority = 0;
-  
-  projectCards.forEach(card => {
-    if (card.dataset.status === 'in-progress') inProgress++;
-    if (card.dataset.status === 'completed') completed++;
-    if (card.dataset.priority === 'high') highPriority++;
-  });
+// AJAX functions for create, update and delete
+function createProject() {
+  const formData = new FormData(projectForm);
 
-  totalProjectsEl.textContent = total;
-  if (inProgressCountEl) inProgressCountEl.textContent = inProgress;
-  if (completedCountEl) completedCountEl.textContent = completed;
-  if (highPriorityCountEl) highPriorityCountEl.textContent = highPriority;
+  fetch('/add-project/', {
+    method: 'POST',
+    body: formData,
+    headers: {
+      'X-CSRFToken': getCookie('csrftoken')
+    }
+  })
+  .then(response => response.json())
+  .then(data => {
+    if (data.success) {
+      hideForm();
+      // Drop the empty state and show the new card first, like the server orders them
+      if (!projectsGrid.querySelector('.project-card')) projectsGrid.innerHTML = '';
+      projectsGrid.insertAdjacentHTML('afterbegin', data.html);
+      setStats(data.stats);
+      setTechOptions(data.technologies);
+    } else if (data.auth_required) {
+      hideForm();
+      showAuthPrompt();
+    } else {
+      alert('Error creating project: ' + data.message);
+    }
+  })
+  .catch(error => {
+    console.error('Error:', error);
+    alert('Error creating project. Please try again.');
+  });
 }
 
-// AJAX functions for update and delete
 function updateProject(projectId) {
   const formData = new FormData(projectForm);
   
@@ -440,11 +541,10 @@ function deleteProject(projectId) {
       // Remove the project card from the DOM
       const projectCard = document.querySelector(`[data-project-id="${projectId}"]`);
       if (projectCard) {
+        // Update stats
+        adjustStats(projectCard, -1);
         projectCard.remove();
       }
-      // Update stats
-      updateStats();
-      updateTechFilter();
     } else {
       alert('Error deleting project: ' + data.message);
     }
@@ -455,6 +555,52 @@ function deleteProject(projectId) {
   });
 }
 
+function selectedProjectIds() {
+  return Array.from(projectsGrid.querySelectorAll('.project-select:checked'), box => Number(box.value));
+}
+
+// Show the bulk actions bar while any card is selected
+function updateBulkBar() {
+  const count = selectedProjectIds().length;
+  bulkCount.textContent = `${count} selected`;
+  bulkBar.classList.toggle('hidden', count === 0);
+  document.getElementById('bulk-status').value = '';
+  document.getElementById('bulk-priority').value = '';
+}
+
+// Apply one operation to several projects in a single request,
+// e.g. bulkProjects([1, 2, 3], 'set_status', 'completed') or bulkProjects(ids, 'delete')
+function bulkProjects(projectIds, operation, value) {
+  return fetch('/projects/bulk/', {
+    method: 'POST',
+    body: JSON.stringify({ ids: projectIds, operation: operation, value: value }),
+    headers: {
+      'Content-Type': 'application/json',
+      'X-CSRFToken': getCookie('csrftoken')
+    }
+  })
+  .then(response => response.json())
+  .then(data => {
+    if (!data.success) {
+      alert('Error updating projects: ' + data.message);
+      return data;
+    }
+    if (operation === 'delete') {
+      data.results.filter(result => result.success).forEach(result => {
+        const projectCard = document.querySelector(`[data-project-id="${result.id}"]`);
+        if (projectCard) {
+          adjustStats(projectCard, -1);
+          projectCard.remove();
+        }
+      });
+    } else {
+      // Reload the page to show updated data
+      window.location.reload();
+    }
+    return data;
+  });
+}
+
 // Helper function to get CSRF token
 function getCookie(name) {
   let cookieValue = null;